@@ -3,13 +3,34 @@ Correlation analysis between Alon's tweets and $PUMP price.
 Identifies patterns, quiet periods, and potential signals.
 """
 from typing import List, Dict, Tuple, Optional
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import pandas as pd
 import numpy as np
 from scipy import stats
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Numba is optional: without it the kernels below run as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# pyarrow is optional: when present, string columns are Arrow-backed
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -17,27 +38,59 @@ TWEETS_FILE = DATA_DIR / "tweets.json"
 PRICES_FILE = DATA_DIR / "prices.json"
 
 
+def _load_frame_cache(json_path: Path) -> Optional[pd.DataFrame]:
+    """Return the parquet cache for json_path if it is at least as new."""
+    cache_path = json_path.with_suffix(".parquet")
+    if (
+        PYARROW_AVAILABLE
+        and cache_path.exists()
+        and cache_path.stat().st_mtime >= json_path.stat().st_mtime
+    ):
+        return pd.read_parquet(cache_path)
+    return None
+
+
+def _save_frame_cache(json_path: Path, df: pd.DataFrame):
+    """Write the parsed frame next to json_path so later runs skip the parse."""
+    if PYARROW_AVAILABLE:
+        df.to_parquet(json_path.with_suffix(".parquet"), compression="zstd")
+
+
+@functools.lru_cache(maxsize=1)
 def load_tweets() -> pd.DataFrame:
-    """Load tweets into a DataFrame."""
-    with open(TWEETS_FILE) as f:
-        data = json.load(f)
+    """Load tweets into a DataFrame (cached; treat the result as read-only)."""
+    cached = _load_frame_cache(TWEETS_FILE)
+    if cached is not None:
+        return cached
+    
+    with open(TWEETS_FILE, "rb") as f:
+        data = orjson.loads(f.read())
     
     df = pd.DataFrame(data["tweets"])
+    if PYARROW_AVAILABLE:
+        df = df.convert_dtypes(dtype_backend="pyarrow")
     df["created_at"] = pd.to_datetime(df["created_at"]).dt.tz_localize(None)
     df["date"] = df["created_at"].dt.date
     df = df.sort_values("created_at")
+    _save_frame_cache(TWEETS_FILE, df)
     return df
 
 
+@functools.lru_cache(maxsize=1)
 def load_prices() -> pd.DataFrame:
-    """Load price data into a DataFrame."""
-    with open(PRICES_FILE) as f:
-        data = json.load(f)
+    """Load price data into a DataFrame (cached; treat the result as read-only)."""
+    cached = _load_frame_cache(PRICES_FILE)
+    if cached is not None:
+        return cached
+    
+    with open(PRICES_FILE, "rb") as f:
+        data = orjson.loads(f.read())
     
     df = pd.DataFrame(data["prices"])
     df["timestamp"] = pd.to_datetime(df["timestamp"])
     df["date"] = df["timestamp"].dt.date
     df = df.sort_values("timestamp")
+    _save_frame_cache(PRICES_FILE, df)
     return df
 
 
@@ -46,28 +99,28 @@ def calculate_tweet_frequency(tweets_df: pd.DataFrame, window_days: int = 7) ->
     Calculate rolling tweet frequency.
     Returns daily tweet counts and rolling averages.
     """
-    # Count tweets per day
-    daily_tweets = tweets_df.groupby("date").size().reset_index(name="tweet_count")
-    daily_tweets["date"] = pd.to_datetime(daily_tweets["date"])
-    
-    # Create a complete date range
-    date_range = pd.date_range(
-        start=daily_tweets["date"].min(),
-        end=daily_tweets["date"].max(),
-        freq="D"
-    )
-    
-    # Reindex to include all dates (fill missing with 0)
-    daily_tweets = daily_tweets.set_index("date").reindex(date_range, fill_value=0)
-    daily_tweets = daily_tweets.reset_index().rename(columns={"index": "date"})
-    
-    # Calculate rolling averages
-    daily_tweets[f"tweets_{window_days}d_avg"] = (
-        daily_tweets["tweet_count"].rolling(window=window_days, min_periods=1).mean()
-    )
-    daily_tweets[f"tweets_{window_days}d_sum"] = (
-        daily_tweets["tweet_count"].rolling(window=window_days, min_periods=1).sum()
-    )
+    # Count tweets per day over a complete date range (missing days are 0)
+    days = tweets_df["created_at"].to_numpy(dtype="datetime64[D]")
+    day0 = days.min()
+    counts = np.bincount((days - day0).astype(np.int64))
+    
+    daily_tweets = pd.DataFrame({
+        "date": pd.date_range(
+            start=day0,
+            periods=len(counts),
+            freq="D"
+        ),
+        "tweet_count": counts,
+    })
+    
+    # Calculate rolling sum and average in one pass via prefix sums
+    # (window shrinks at the start, matching rolling(min_periods=1))
+    counts = daily_tweets["tweet_count"].to_numpy()
+    cs = np.concatenate(([0], np.cumsum(counts)))
+    idx = np.arange(1, len(counts) + 1)
+    roll_sum = (cs[idx] - cs[np.maximum(idx - window_days, 0)]).astype(float)
+    daily_tweets[f"tweets_{window_days}d_avg"] = roll_sum / np.minimum(idx, window_days)
+    daily_tweets[f"tweets_{window_days}d_sum"] = roll_sum
     
     return daily_tweets
 
@@ -76,26 +129,32 @@ def merge_tweet_price_data(tweets_df: pd.DataFrame, prices_df: pd.DataFrame) ->
     """
     Merge tweet frequency data with price data by date.
     """
-    # Get daily tweet counts
+    # Get daily tweet counts, keyed by integer day number (datetime64[D])
     tweet_freq = calculate_tweet_frequency(tweets_df)
-    tweet_freq["date"] = pd.to_datetime(tweet_freq["date"]).dt.date
+    tweet_freq = tweet_freq.drop(columns="date").assign(
+        date_key=tweet_freq["date"].to_numpy(dtype="datetime64[D]").view("int64")
+    )
     
-    # Prepare price data
-    prices = prices_df.copy()
-    prices["date"] = pd.to_datetime(prices["date"])
-    prices["date"] = prices["date"].dt.date
+    # Prepare price data with the same integer day key
+    price_days = (
+        pd.to_datetime(prices_df["timestamp"])
+        .dt.tz_localize(None)
+        .to_numpy(dtype="datetime64[D]")
+    )
+    prices = prices_df.assign(date_key=price_days.view("int64"))
     
-    # Merge on date
-    merged = prices.merge(tweet_freq, on="date", how="left")
+    # Merge on the int64 key (much cheaper than hashing date objects)
+    merged = prices.merge(tweet_freq, on="date_key", how="left").drop(columns="date_key")
     
     # Fill NaN tweet counts with 0 (days before tweeting started)
-    merged["tweet_count"] = merged["tweet_count"].fillna(0)
-    merged["tweets_7d_avg"] = merged["tweets_7d_avg"].fillna(0)
-    merged["tweets_7d_sum"] = merged["tweets_7d_sum"].fillna(0)
+    merged.fillna({"tweet_count": 0, "tweets_7d_avg": 0, "tweets_7d_sum": 0}, inplace=True)
     
-    # Calculate price changes
-    merged["price_change_1d"] = merged["close"].pct_change() * 100
-    merged["price_change_7d"] = merged["close"].pct_change(periods=7) * 100
+    # Calculate price changes as shifted ratios on the raw close array
+    close = merged["close"].to_numpy(dtype=float)
+    for k in (1, 7):
+        change = np.full_like(close, np.nan)
+        change[k:] = (close[k:] / close[:-k] - 1.0) * 100
+        merged[f"price_change_{k}d"] = change
     
     return merged
 
@@ -105,29 +164,30 @@ def identify_quiet_periods(tweets_df: pd.DataFrame, min_gap_days: int = 3) -> Li
     Identify periods where Alon stopped tweeting.
     Returns list of quiet periods with start, end, and duration.
     """
-    tweets_df = tweets_df.sort_values("created_at")
-    
-    quiet_periods = []
-    prev_date = None
-    
-    for _, row in tweets_df.iterrows():
-        curr_date = row["created_at"]
-        
-        if prev_date is not None:
-            gap = (curr_date - prev_date).days
-            if gap >= min_gap_days:
-                quiet_periods.append({
-                    "start": prev_date.isoformat(),
-                    "end": curr_date.isoformat(),
-                    "gap_days": gap,
-                    "last_tweet_before": prev_date.strftime("%Y-%m-%d"),
-                    "first_tweet_after": curr_date.strftime("%Y-%m-%d"),
-                })
-        
-        prev_date = curr_date
+    created = tweets_df["created_at"]
+    if not created.is_monotonic_increasing:
+        created = created.sort_values()
+    
+    # Gap in whole days between consecutive tweets, computed in one pass
+    ts = created.to_numpy(dtype="datetime64[ns]")
+    gaps_days = np.diff(ts) // np.timedelta64(1, "D")
+    idx = np.nonzero(gaps_days >= min_gap_days)[0]
+    
+    quiet_periods = [
+        {
+            "start": prev_date.isoformat(),
+            "end": curr_date.isoformat(),
+            "gap_days": int(gap),
+            "last_tweet_before": prev_date.strftime("%Y-%m-%d"),
+            "first_tweet_after": curr_date.strftime("%Y-%m-%d"),
+        }
+        for prev_date, curr_date, gap in zip(
+            created.iloc[idx], created.iloc[idx + 1], gaps_days[idx]
+        )
+    ]
     
     # Check if currently in a quiet period (no tweets recently)
-    last_tweet = tweets_df["created_at"].max()
+    last_tweet = created.iloc[-1]
     days_since_last = (datetime.now() - last_tweet.to_pydatetime().replace(tzinfo=None)).days
     
     if days_since_last >= min_gap_days:
@@ -143,6 +203,29 @@ def identify_quiet_periods(tweets_df: pd.DataFrame, min_gap_days: int = 3) -> Li
     return quiet_periods
 
 
+@njit(cache=True)
+def _window_min_max(price_close, i_lo, i_hi):
+    """Min/max close over each [lo, hi) window (NaN for empty windows)."""
+    n = len(i_lo)
+    price_min = np.full(n, np.nan)
+    price_max = np.full(n, np.nan)
+    
+    for k in range(n):
+        lowest = np.inf
+        highest = -np.inf
+        for j in range(i_lo[k], i_hi[k]):
+            c = price_close[j]
+            if c < lowest:
+                lowest = c
+            if c > highest:
+                highest = c
+        if lowest <= highest:
+            price_min[k] = lowest
+            price_max[k] = highest
+    
+    return price_min, price_max
+
+
 def analyze_quiet_period_impact(
     merged_df: pd.DataFrame,
     quiet_periods: List[Dict],
@@ -151,35 +234,43 @@ def analyze_quiet_period_impact(
     """
     Analyze what happened to price during and after quiet periods.
     """
-    prices_df = prices_df.copy()
-    prices_df["timestamp"] = pd.to_datetime(prices_df["timestamp"]).dt.tz_localize(None)
+    # Prices are sorted by timestamp, so each lookup is a binary search
+    ts_arr = (
+        pd.to_datetime(prices_df["timestamp"])
+        .dt.tz_localize(None)
+        .to_numpy(dtype="datetime64[ns]")
+    )
+    close_arr = prices_df["close"].to_numpy(dtype=float)
+    
+    # Batch every quiet period's bounds so each lookup is one vectorized
+    # searchsorted over all periods
+    now = pd.Timestamp(datetime.now())
+    starts = pd.to_datetime([qp["start"] for qp in quiet_periods]).tz_localize(None)
+    ends = pd.to_datetime(
+        [now if qp.get("is_current") else qp["end"] for qp in quiet_periods]
+    ).tz_localize(None)
+    starts = starts.to_numpy(dtype="datetime64[ns]")
+    ends = ends.to_numpy(dtype="datetime64[ns]")
+    
+    i_before = np.searchsorted(ts_arr, starts, side="right") - 1
+    i_after = np.searchsorted(ts_arr, ends, side="left")
+    i_lo = np.searchsorted(ts_arr, starts, side="left")
+    i_hi = np.searchsorted(ts_arr, ends, side="right")
+    mins, maxs = _window_min_max(close_arr, i_lo, i_hi)
     
     results = []
     
-    for qp in quiet_periods:
-        start = pd.to_datetime(qp["start"]).tz_localize(None)
+    for k, qp in enumerate(quiet_periods):
+        # Price at start (last close at or before start) and end (first
+        # close at or after end) of the quiet period
+        price_before = close_arr[i_before[k]] if i_before[k] >= 0 else None
+        price_after = close_arr[i_after[k]] if i_after[k] < len(close_arr) else None
         
-        if qp.get("is_current"):
-            end = datetime.now()
-        else:
-            end = pd.to_datetime(qp["end"]).tz_localize(None)
-        
-        # Get price at start of quiet period
-        price_before = prices_df[prices_df["timestamp"] <= start]["close"].iloc[-1] if len(prices_df[prices_df["timestamp"] <= start]) > 0 else None
-        
-        # Get price at end of quiet period
-        price_after = prices_df[prices_df["timestamp"] >= end]["close"].iloc[0] if len(prices_df[prices_df["timestamp"] >= end]) > 0 else None
-        
-        # Get price during quiet period (min, max, end)
-        during_period = prices_df[
-            (prices_df["timestamp"] >= start) & 
-            (prices_df["timestamp"] <= end)
-        ]
-        
-        if len(during_period) > 0:
-            price_min = during_period["close"].min()
-            price_max = during_period["close"].max()
-            price_at_end = during_period["close"].iloc[-1]
+        # Price during quiet period (min, max, end)
+        if i_hi[k] > i_lo[k]:
+            price_min = mins[k]
+            price_max = maxs[k]
+            price_at_end = close_arr[i_hi[k] - 1]
         else:
             price_min = price_max = price_at_end = None
         
@@ -204,56 +295,70 @@ def analyze_quiet_period_impact(
     return results
 
 
+def _pearson_p_values(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Two-tailed p-values for Pearson r values computed over n samples."""
+    r = np.clip(r, -1.0, 1.0)
+    with np.errstate(divide="ignore"):
+        t = r * np.sqrt((n - 2) / (1.0 - r * r))
+    return 2 * stats.t.sf(np.abs(t), n - 2)
+
+
 def calculate_correlation(merged_df: pd.DataFrame) -> Dict:
     """
     Calculate various correlation metrics between tweet activity and price.
     """
-    df = merged_df.dropna()
-    
-    if len(df) < 10:
+    # Only four series are consumed, so rather than dropna() copying every
+    # column, build one row mask and apply it to those arrays. The mask
+    # keeps dropna()'s row selection (e.g. the 7d-change warm-up rows stay
+    # excluded) so the reported correlations do not shift.
+    m = merged_df.notna().all(axis=1).to_numpy()
+    tc = merged_df["tweet_count"].to_numpy(dtype=float)[m]
+    pc = merged_df["price_change_1d"].to_numpy(dtype=float)[m]
+    tavg = merged_df["tweets_7d_avg"].to_numpy(dtype=float)[m]
+    cl = merged_df["close"].to_numpy(dtype=float)[m]
+    n = len(tc)
+    
+    if n < 10:
         return {"error": "Not enough overlapping data points"}
     
     results = {}
     
+    # Same-day pairs come from one correlation matrix over the stacked
+    # series; the predictive pair pairs each day with the next row's change
+    C = np.corrcoef(np.vstack([tc, pc, tavg, cl]))
+    corrs = np.array([C[0, 1], C[2, 3], np.corrcoef(tc[:-1], pc[1:])[0, 1]])
+    p_values = _pearson_p_values(corrs, np.array([n, n, n - 1]))
+    
     # 1. Pearson correlation: tweet count vs price change
-    if "tweet_count" in df.columns and "price_change_1d" in df.columns:
-        corr, p_value = stats.pearsonr(df["tweet_count"], df["price_change_1d"])
-        results["tweet_count_vs_price_1d"] = {
-            "correlation": corr,
-            "p_value": p_value,
-            "significant": p_value < 0.05,
-        }
+    results["tweet_count_vs_price_1d"] = {
+        "correlation": float(corrs[0]),
+        "p_value": float(p_values[0]),
+        "significant": bool(p_values[0] < 0.05),
+    }
     
     # 2. Rolling tweet average vs price
-    if "tweets_7d_avg" in df.columns and "close" in df.columns:
-        corr, p_value = stats.pearsonr(df["tweets_7d_avg"], df["close"])
-        results["tweets_7d_avg_vs_price"] = {
-            "correlation": corr,
-            "p_value": p_value,
-            "significant": p_value < 0.05,
-        }
+    results["tweets_7d_avg_vs_price"] = {
+        "correlation": float(corrs[1]),
+        "p_value": float(p_values[1]),
+        "significant": bool(p_values[1] < 0.05),
+    }
     
     # 3. Tweet activity vs next day's price change (predictive)
-    df_shifted = df.copy()
-    df_shifted["next_day_change"] = df_shifted["price_change_1d"].shift(-1)
-    df_shifted = df_shifted.dropna()
-    
-    if len(df_shifted) > 10:
-        corr, p_value = stats.pearsonr(df_shifted["tweet_count"], df_shifted["next_day_change"])
+    if n - 1 > 10:
         results["tweet_count_vs_next_day_price"] = {
-            "correlation": corr,
-            "p_value": p_value,
-            "significant": p_value < 0.05,
+            "correlation": float(corrs[2]),
+            "p_value": float(p_values[2]),
+            "significant": bool(p_values[2] < 0.05),
         }
     
     # 4. High activity vs low activity comparison
-    high_activity = df[df["tweet_count"] >= 2]
-    low_activity = df[df["tweet_count"] == 0]
+    high_activity = pc[tc >= 2]
+    low_activity = pc[tc == 0]
     
     if len(high_activity) > 5 and len(low_activity) > 5:
         results["high_vs_low_activity"] = {
-            "high_activity_avg_return": high_activity["price_change_1d"].mean(),
-            "low_activity_avg_return": low_activity["price_change_1d"].mean(),
+            "high_activity_avg_return": high_activity.mean(),
+            "low_activity_avg_return": low_activity.mean(),
             "high_activity_days": len(high_activity),
             "low_activity_days": len(low_activity),
         }
@@ -261,37 +366,62 @@ def calculate_correlation(merged_df: pd.DataFrame) -> Dict:
     return results
 
 
+def _return_moments(returns: np.ndarray) -> Tuple[np.ndarray, int, float, float]:
+    """
+    Drop NaNs and derive count, mean and sample variance from one
+    sum / sum-of-squares pass over the remaining returns.
+    """
+    valid = returns[~np.isnan(returns)]
+    n = valid.size
+    if n == 0:
+        return valid, 0, np.nan, np.nan
+    
+    mean = valid.sum() / n
+    var = (valid @ valid - n * mean * mean) / (n - 1) if n > 1 else np.nan
+    return valid, n, mean, var
+
+
+def _return_stats(returns: np.ndarray, valid: np.ndarray, mean: float) -> Dict:
+    """Summarize an array of daily % returns (NaN entries are ignored)."""
+    if len(returns) == 0:
+        return {"count": 0, "avg_return": 0, "median_return": 0, "positive_days": 0, "negative_days": 0}
+    
+    return {
+        "count": len(returns),
+        "avg_return": mean,
+        "median_return": np.median(valid) if valid.size else np.nan,
+        "positive_days": (valid > 0).sum(),
+        "negative_days": (valid < 0).sum(),
+    }
+
+
 def analyze_tweet_impact(merged_df: pd.DataFrame, tweets_df: pd.DataFrame) -> Dict:
     """
     Analyze the immediate price impact of individual tweets.
     """
-    # Find days with tweets and their price performance
-    tweet_days = merged_df[merged_df["tweet_count"] > 0].copy()
-    no_tweet_days = merged_df[merged_df["tweet_count"] == 0].copy()
+    # Find days with tweets and their price performance (masks over one
+    # extracted array; nothing is mutated so no frame copies are needed)
+    pc = merged_df["price_change_1d"].to_numpy(dtype=float)
+    tc = merged_df["tweet_count"].to_numpy()
+    pc_t = pc[tc > 0]
+    pc_n = pc[tc == 0]
+    
+    valid_t, n_t, mean_t, var_t = _return_moments(pc_t)
+    valid_n, n_n, mean_n, var_n = _return_moments(pc_n)
     
     results = {
-        "tweet_day_stats": {
-            "count": len(tweet_days),
-            "avg_return": tweet_days["price_change_1d"].mean() if len(tweet_days) > 0 else 0,
-            "median_return": tweet_days["price_change_1d"].median() if len(tweet_days) > 0 else 0,
-            "positive_days": (tweet_days["price_change_1d"] > 0).sum() if len(tweet_days) > 0 else 0,
-            "negative_days": (tweet_days["price_change_1d"] < 0).sum() if len(tweet_days) > 0 else 0,
-        },
-        "no_tweet_day_stats": {
-            "count": len(no_tweet_days),
-            "avg_return": no_tweet_days["price_change_1d"].mean() if len(no_tweet_days) > 0 else 0,
-            "median_return": no_tweet_days["price_change_1d"].median() if len(no_tweet_days) > 0 else 0,
-            "positive_days": (no_tweet_days["price_change_1d"] > 0).sum() if len(no_tweet_days) > 0 else 0,
-            "negative_days": (no_tweet_days["price_change_1d"] < 0).sum() if len(no_tweet_days) > 0 else 0,
-        },
+        "tweet_day_stats": _return_stats(pc_t, valid_t, mean_t),
+        "no_tweet_day_stats": _return_stats(pc_n, valid_n, mean_n),
     }
     
     # Statistical test: are returns different on tweet days vs non-tweet days?
-    if len(tweet_days) > 5 and len(no_tweet_days) > 5:
-        t_stat, p_value = stats.ttest_ind(
-            tweet_days["price_change_1d"].dropna(),
-            no_tweet_days["price_change_1d"].dropna()
-        )
+    # Pooled-variance two-sample t-test (same as stats.ttest_ind) built from
+    # the moments above instead of re-scanning both arrays.
+    if len(pc_t) > 5 and len(pc_n) > 5:
+        dof = n_t + n_n - 2
+        pooled_var = ((n_t - 1) * var_t + (n_n - 1) * var_n) / dof
+        t_stat = (mean_t - mean_n) / np.sqrt(pooled_var * (1.0 / n_t + 1.0 / n_n))
+        p_value = 2 * stats.t.sf(abs(t_stat), dof)
         results["statistical_test"] = {
             "t_statistic": t_stat,
             "p_value": p_value,
@@ -316,18 +446,22 @@ def generate_report() -> Dict:
     merged = merge_tweet_price_data(tweets_df, prices_df)
     print(f"Merged dataset: {len(merged)} days")
     
-    print("\nIdentifying quiet periods...")
-    quiet_periods = identify_quiet_periods(tweets_df)
-    print(f"Found {len(quiet_periods)} quiet periods (3+ days)")
-    
-    print("\nAnalyzing quiet period impact...")
-    quiet_impact = analyze_quiet_period_impact(merged, quiet_periods, prices_df)
-    
-    print("\nCalculating correlations...")
-    correlations = calculate_correlation(merged)
-    
-    print("\nAnalyzing tweet impact...")
-    tweet_impact = analyze_tweet_impact(merged, tweets_df)
+    # Quiet periods, correlations and tweet impact only read the frames
+    # built above, so run them side by side (numpy/pandas release the GIL)
+    print("\nIdentifying quiet periods, calculating correlations, analyzing tweet impact...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        quiet_future = executor.submit(identify_quiet_periods, tweets_df)
+        correlations_future = executor.submit(calculate_correlation, merged)
+        tweet_impact_future = executor.submit(analyze_tweet_impact, merged, tweets_df)
+        
+        quiet_periods = quiet_future.result()
+        print(f"Found {len(quiet_periods)} quiet periods (3+ days)")
+        
+        print("\nAnalyzing quiet period impact...")
+        quiet_impact = analyze_quiet_period_impact(merged, quiet_periods, prices_df)
+        
+        correlations = correlations_future.result()
+        tweet_impact = tweet_impact_future.result()
     
     report = {
         "generated_at": datetime.now().isoformat(),
@@ -347,7 +481,9 @@ def generate_report() -> Dict:
         "correlations": correlations,
         "tweet_impact": tweet_impact,
         "quiet_periods": quiet_impact,
-        "merged_data": merged.to_dict(orient="records"),
+        # Columnar (one array per column) so orjson can serialize the numpy
+        # buffers directly instead of building a dict per row
+        "merged_data": {col: merged[col].to_numpy() for col in merged.columns},
     }
     
     return report
@@ -421,6 +557,16 @@ def print_summary(report: Dict):
             print(f"      {direction} Price change during silence: {change:.1f}%")
 
 
+def _json_default(obj):
+    """Serialize the types orjson does not know about natively."""
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        # Object-dtype columns (e.g. date) fall through OPT_SERIALIZE_NUMPY
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 def main():
     """Run the analysis and print results."""
     report = generate_report()
@@ -429,32 +575,13 @@ def main():
     # Save full report
     output_file = DATA_DIR / "analysis_report.json"
     
-    # Convert non-serializable objects
-    def convert_for_json(obj):
-        if isinstance(obj, (pd.Timestamp, datetime)):
-            return obj.isoformat()
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if pd.isna(obj):
-            return None
-        return obj
-    
-    # Clean the report for JSON serialization
-    def clean_for_json(data):
-        if isinstance(data, dict):
-            return {k: clean_for_json(v) for k, v in data.items()}
-        if isinstance(data, list):
-            return [clean_for_json(v) for v in data]
-        return convert_for_json(data)
-    
-    clean_report = clean_for_json(report)
-    
-    with open(output_file, "w") as f:
-        json.dump(clean_report, f, indent=2, default=str)
+    # orjson handles numpy scalars/arrays, dates and NaN (as null) natively
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=_json_default,
+        ))
     
     print(f"\n💾 Full report saved to: {output_file}")
     
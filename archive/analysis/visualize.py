@@ -3,7 +3,9 @@ Generate interactive visualizations for the tweet-price correlation analysis.
 Creates HTML charts using Plotly that can be opened in any browser.
 """
 from typing import List, Dict
-import json
+import argparse
+import heapq
+import orjson
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -11,28 +13,86 @@ from plotly.subplots import make_subplots
 from pathlib import Path
 from datetime import datetime
 
+# Optional: parquet cache of the merged data (falls back to the JSON report)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = PROJECT_ROOT / "output"
+REPORT_FILE = DATA_DIR / "analysis_report.json"
+MERGED_CACHE_FILE = DATA_DIR / "merged_data.parquet"
+REPORT_META_FILE = DATA_DIR / "report_meta.json"
 
 # Ensure output directory exists
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Reference plotly.js from the CDN instead of inlining ~3.5 MB into every
+# file, and skip re-validating figures that were validated as they were built
+WRITE_HTML_OPTIONS = dict(include_plotlyjs="cdn", validate=False, auto_open=False)
+
+# Dark theme shared by every chart
+BASE_LAYOUT = dict(
+    template="plotly_dark",
+    paper_bgcolor="#0D1117",
+    plot_bgcolor="#0D1117",
+)
+
+
+def convert_report(report: Dict):
+    """
+    Split the report into a parquet file for merged_data and a small JSON
+    file for everything else, so chart re-runs skip the big JSON parse.
+    """
+    meta = {k: v for k, v in report.items() if k != "merged_data"}
+    REPORT_META_FILE.write_bytes(orjson.dumps(meta))
+    build_merged_frame(report).to_parquet(MERGED_CACHE_FILE, compression="zstd")
+
 
 def load_analysis_report() -> Dict:
-    """Load the analysis report."""
-    with open(DATA_DIR / "analysis_report.json") as f:
-        return json.load(f)
+    """Load the analysis report, from the parquet split cache when it is fresh."""
+    report_mtime = REPORT_FILE.stat().st_mtime
+    if PYARROW_AVAILABLE and all(
+        p.exists() and p.stat().st_mtime >= report_mtime
+        for p in (MERGED_CACHE_FILE, REPORT_META_FILE)
+    ):
+        report = orjson.loads(REPORT_META_FILE.read_bytes())
+        report["merged_data"] = pd.read_parquet(MERGED_CACHE_FILE)
+        return report
+    
+    # merged_data is already stored columnar (one list per column), so
+    # orjson hands pandas flat lists rather than a list of row dicts
+    report = orjson.loads(REPORT_FILE.read_bytes())
+    if PYARROW_AVAILABLE:
+        convert_report(report)
+    return report
+
+
+def build_merged_frame(report: Dict) -> pd.DataFrame:
+    """
+    Build the merged tweet/price frame once, with dates parsed, so every
+    chart builder can share it instead of re-constructing its own.
+    """
+    merged_data = pd.DataFrame(report["merged_data"])
+    merged_data["date"] = pd.to_datetime(merged_data["date"], format="ISO8601")
+    return merged_data
 
 
-def create_dual_axis_chart(report: Dict) -> go.Figure:
+def create_dual_axis_chart(report: Dict, merged_data: pd.DataFrame) -> go.Figure:
     """
     Create the main visualization: tweet frequency vs price over time.
     Dual-axis chart with tweet bars and price line.
     """
-    merged_data = pd.DataFrame(report["merged_data"])
-    merged_data["date"] = pd.to_datetime(merged_data["date"])
+    # Pull the plotted columns straight into typed numpy arrays; float32 /
+    # int32 keep the serialized figure small
+    dates = merged_data["date"].to_numpy(dtype="datetime64[ns]")
+    close = merged_data["close"].to_numpy(dtype=np.float32)
+    tweet_count = merged_data["tweet_count"].to_numpy(dtype=np.int32)
+    tweets_7d_avg = merged_data["tweets_7d_avg"].to_numpy(dtype=np.float32)
     
     # Create figure with secondary y-axis
     fig = make_subplots(
@@ -43,46 +103,50 @@ def create_dual_axis_chart(report: Dict) -> go.Figure:
         subplot_titles=("$PUMP Price vs Alon's Tweet Activity", "Daily Tweet Count")
     )
     
-    # Price line (primary y-axis, row 1)
-    fig.add_trace(
-        go.Scatter(
-            x=merged_data["date"],
-            y=merged_data["close"],
-            name="$PUMP Price",
-            line=dict(color="#00D4AA", width=2),
-            fill="tozeroy",
-            fillcolor="rgba(0, 212, 170, 0.1)",
-        ),
-        row=1, col=1
-    )
-    
-    # 7-day rolling tweet average (secondary y-axis, row 1)
-    fig.add_trace(
-        go.Scatter(
-            x=merged_data["date"],
-            y=merged_data["tweets_7d_avg"],
-            name="Tweet Frequency (7d avg)",
-            line=dict(color="#FF6B6B", width=2, dash="dot"),
-            yaxis="y2"
-        ),
-        row=1, col=1
-    )
+    # Tweet count bar colors (row 2)
+    colors = np.where(tweet_count > 0, "#FF6B6B", "#333333")
     
-    # Tweet count bars (row 2)
-    colors = ["#FF6B6B" if c > 0 else "#333333" for c in merged_data["tweet_count"]]
-    fig.add_trace(
-        go.Bar(
-            x=merged_data["date"],
-            y=merged_data["tweet_count"],
-            name="Daily Tweets",
-            marker_color=colors,
-            opacity=0.7,
-        ),
-        row=2, col=1
+    # Add every trace in one batch instead of one validated add_trace each
+    fig.add_traces(
+        [
+            # Price line (primary y-axis, row 1)
+            go.Scatter(
+                x=dates,
+                y=close,
+                name="$PUMP Price",
+                line=dict(color="#00D4AA", width=2),
+                fill="tozeroy",
+                fillcolor="rgba(0, 212, 170, 0.1)",
+            ),
+            # 7-day rolling tweet average (secondary y-axis, row 1)
+            go.Scatter(
+                x=dates,
+                y=tweets_7d_avg,
+                name="Tweet Frequency (7d avg)",
+                line=dict(color="#FF6B6B", width=2, dash="dot"),
+                yaxis="y2"
+            ),
+            # Tweet count bars (row 2)
+            go.Bar(
+                x=dates,
+                y=tweet_count,
+                name="Daily Tweets",
+                marker_color=colors,
+                opacity=0.7,
+            ),
+        ],
+        rows=[1, 1, 2],
+        cols=[1, 1, 1],
     )
     
-    # Highlight quiet periods (more than 7 days)
+    # Highlight quiet periods (more than 7 days). Shapes and annotations are
+    # collected as plain dicts and set in one layout update rather than one
+    # validated add_vrect/add_annotation call each
     quiet_periods = [qp for qp in report["quiet_periods"] if qp["gap_days"] >= 7]
+    first_date, last_date = pd.Timestamp(dates.min()), pd.Timestamp(dates.max())
+    annotation_y = np.nanmax(close) * 0.9
+    shapes = []
+    annotations = []
     
     for qp in quiet_periods:
         start = pd.to_datetime(qp["start"].split("T")[0])
@@ -92,26 +156,34 @@ def create_dual_axis_chart(report: Dict) -> go.Figure:
             end = pd.to_datetime(qp["end"].split("T")[0])
         
         # Only add if within our date range
-        if end >= merged_data["date"].min() and start <= merged_data["date"].max():
-            fig.add_vrect(
+        if end >= first_date and start <= last_date:
+            shapes.append(dict(
+                type="rect",
+                xref="x", yref="y domain",
                 x0=start, x1=end,
+                y0=0, y1=1,
                 fillcolor="rgba(255, 107, 107, 0.15)",
                 layer="below",
-                line_width=0,
-                row=1, col=1
-            )
+                line=dict(width=0),
+            ))
             
             # Add annotation for significant drops
             if qp.get("price_change_during") and qp["price_change_during"] < -10:
                 mid_date = start + (end - start) / 2
-                fig.add_annotation(
+                annotations.append(dict(
+                    xref="x", yref="y",
                     x=mid_date,
-                    y=merged_data["close"].max() * 0.9,
+                    y=annotation_y,
                     text=f"🔇 {qp['gap_days']}d silence<br>{qp['price_change_during']:.0f}%",
                     showarrow=False,
                     font=dict(size=10, color="#FF6B6B"),
-                    row=1, col=1
-                )
+                ))
+    
+    # Keep the subplot titles, which are layout annotations too
+    fig.update_layout(
+        shapes=shapes,
+        annotations=[*fig.layout.annotations, *annotations],
+    )
     
     # Update layout
     fig.update_layout(
@@ -120,9 +192,7 @@ def create_dual_axis_chart(report: Dict) -> go.Figure:
             font=dict(size=24, color="#FFFFFF"),
             x=0.5,
         ),
-        template="plotly_dark",
-        paper_bgcolor="#0D1117",
-        plot_bgcolor="#0D1117",
+        **BASE_LAYOUT,
         hovermode="x unified",
         legend=dict(
             orientation="h",
@@ -177,31 +247,30 @@ def create_comparison_chart(report: Dict) -> go.Figure:
         specs=[[{"type": "bar"}, {"type": "bar"}]]
     )
     
-    # Average returns
     colors = ["#00D4AA" if r > 0 else "#FF6B6B" for r in avg_returns]
-    fig.add_trace(
-        go.Bar(
-            x=categories,
-            y=avg_returns,
-            marker_color=colors,
-            text=[f"{r:+.2f}%" for r in avg_returns],
-            textposition="outside",
-            textfont=dict(size=16, color="white"),
-        ),
-        row=1, col=1
-    )
-    
-    # Win rates
-    fig.add_trace(
-        go.Bar(
-            x=categories,
-            y=win_rates,
-            marker_color=["#00D4AA", "#666666"],
-            text=[f"{r:.0f}%" for r in win_rates],
-            textposition="outside",
-            textfont=dict(size=16, color="white"),
-        ),
-        row=1, col=2
+    fig.add_traces(
+        [
+            # Average returns
+            go.Bar(
+                x=categories,
+                y=avg_returns,
+                marker_color=colors,
+                text=[f"{r:+.2f}%" for r in avg_returns],
+                textposition="outside",
+                textfont=dict(size=16, color="white"),
+            ),
+            # Win rates
+            go.Bar(
+                x=categories,
+                y=win_rates,
+                marker_color=["#00D4AA", "#666666"],
+                text=[f"{r:.0f}%" for r in win_rates],
+                textposition="outside",
+                textfont=dict(size=16, color="white"),
+            ),
+        ],
+        rows=[1, 1],
+        cols=[1, 2],
     )
     
     fig.update_layout(
@@ -210,9 +279,7 @@ def create_comparison_chart(report: Dict) -> go.Figure:
             font=dict(size=20, color="#FFFFFF"),
             x=0.5,
         ),
-        template="plotly_dark",
-        paper_bgcolor="#0D1117",
-        plot_bgcolor="#0D1117",
+        **BASE_LAYOUT,
         showlegend=False,
         height=450,
         yaxis=dict(
@@ -256,14 +323,14 @@ def create_quiet_period_chart(report: Dict) -> go.Figure:
     if not quiet_periods:
         return None
     
-    # Sort by gap days
-    quiet_periods.sort(key=lambda x: x["gap_days"], reverse=True)
+    # Longest 15 by gap days (heap select; only these are rendered)
+    quiet_periods = heapq.nlargest(15, quiet_periods, key=lambda x: x["gap_days"])
     
     labels = []
     changes = []
     colors = []
     
-    for qp in quiet_periods[:15]:  # Top 15
+    for qp in quiet_periods:
         if qp.get("is_current"):
             label = f"CURRENT ({qp['gap_days']}d)"
         else:
@@ -273,18 +340,18 @@ def create_quiet_period_chart(report: Dict) -> go.Figure:
         changes.append(qp["price_change_during"])
         colors.append("#FF6B6B" if qp["price_change_during"] < 0 else "#00D4AA")
     
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Bar(
-            y=labels,
-            x=changes,
-            orientation="h",
-            marker_color=colors,
-            text=[f"{c:+.1f}%" for c in changes],
-            textposition="outside",
-            textfont=dict(color="white"),
-        )
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                y=labels,
+                x=changes,
+                orientation="h",
+                marker_color=colors,
+                text=[f"{c:+.1f}%" for c in changes],
+                textposition="outside",
+                textfont=dict(color="white"),
+            )
+        ]
     )
     
     fig.update_layout(
@@ -293,9 +360,7 @@ def create_quiet_period_chart(report: Dict) -> go.Figure:
             font=dict(size=20, color="#FFFFFF"),
             x=0.5,
         ),
-        template="plotly_dark",
-        paper_bgcolor="#0D1117",
-        plot_bgcolor="#0D1117",
+        **BASE_LAYOUT,
         height=500,
         xaxis=dict(
             title="Price Change During Silence (%)",
@@ -313,15 +378,11 @@ def create_quiet_period_chart(report: Dict) -> go.Figure:
     return fig
 
 
-def create_correlation_scatter(report: Dict) -> go.Figure:
+def create_correlation_scatter(report: Dict, merged_data: pd.DataFrame) -> go.Figure:
     """
     Scatter plot showing relationship between tweet activity and price.
     """
-    merged_data = pd.DataFrame(report["merged_data"])
-    
-    fig = go.Figure()
-    
-    fig.add_trace(
+    traces = [
         go.Scatter(
             x=merged_data["tweets_7d_sum"],
             y=merged_data["close"],
@@ -333,30 +394,33 @@ def create_correlation_scatter(report: Dict) -> go.Figure:
                 showscale=True,
                 colorbar=dict(title="Daily Tweets"),
             ),
-            text=merged_data["date"].astype(str),
+            text=merged_data["date"].dt.strftime("%Y-%m-%d"),
             hovertemplate="Date: %{text}<br>7d Tweets: %{x}<br>Price: $%{y:.4f}<extra></extra>",
         )
-    )
+    ]
     
-    # Add trend line
-    x = merged_data["tweets_7d_sum"].dropna()
-    y = merged_data.loc[x.index, "close"]
+    # Add trend line (plain arrays + mask instead of pandas index alignment)
+    x = merged_data["tweets_7d_sum"].to_numpy(dtype=np.float64)
+    y = merged_data["close"].to_numpy(dtype=np.float64)
+    mask = ~np.isnan(x)
+    x, y = x[mask], y[mask]
     
     if len(x) > 2:
-        z = np.polyfit(x, y, 1)
-        p = np.poly1d(z)
+        slope, intercept = np.polyfit(x, y, 1)
         x_line = np.linspace(x.min(), x.max(), 100)
         
-        fig.add_trace(
+        traces.append(
             go.Scatter(
                 x=x_line,
-                y=p(x_line),
+                y=slope * x_line + intercept,
                 mode="lines",
                 name="Trend",
                 line=dict(color="#FF6B6B", dash="dash", width=2),
             )
         )
     
+    fig = go.Figure(data=traces)
+    
     # Get correlation value
     corr = report["correlations"].get("tweets_7d_avg_vs_price", {})
     corr_val = corr.get("correlation", 0)
@@ -368,9 +432,7 @@ def create_correlation_scatter(report: Dict) -> go.Figure:
             font=dict(size=20, color="#FFFFFF"),
             x=0.5,
         ),
-        template="plotly_dark",
-        paper_bgcolor="#0D1117",
-        plot_bgcolor="#0D1117",
+        **BASE_LAYOUT,
         height=500,
         xaxis=dict(
             title="Tweets in Last 7 Days",
@@ -386,7 +448,7 @@ def create_correlation_scatter(report: Dict) -> go.Figure:
     return fig
 
 
-def create_summary_dashboard(report: Dict) -> go.Figure:
+def create_summary_dashboard(report: Dict, merged_data: pd.DataFrame) -> go.Figure:
     """
     Create a comprehensive dashboard with all key metrics.
     """
@@ -411,11 +473,11 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
         horizontal_spacing=0.1,
     )
     
-    merged_data = pd.DataFrame(report["merged_data"])
-    merged_data["date"] = pd.to_datetime(merged_data["date"])
+    # Collect (trace, row, col, secondary_y) and add them in one batch
+    panels = []
     
     # 1. Price line
-    fig.add_trace(
+    panels.append((
         go.Scatter(
             x=merged_data["date"],
             y=merged_data["close"],
@@ -424,23 +486,23 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
             fill="tozeroy",
             fillcolor="rgba(0, 212, 170, 0.1)",
         ),
-        row=1, col=1, secondary_y=False
-    )
+        1, 1, False
+    ))
     
     # Tweet avg on secondary y
-    fig.add_trace(
+    panels.append((
         go.Scatter(
             x=merged_data["date"],
             y=merged_data["tweets_7d_avg"],
             name="Tweets (7d avg)",
             line=dict(color="#FF6B6B", width=2, dash="dot"),
         ),
-        row=1, col=1, secondary_y=True
-    )
+        1, 1, True
+    ))
     
     # 2. Tweet vs No-Tweet comparison
     ti = report["tweet_impact"]
-    fig.add_trace(
+    panels.append((
         go.Bar(
             x=["Tweet Days", "No-Tweet Days"],
             y=[ti["tweet_day_stats"]["avg_return"], ti["no_tweet_day_stats"]["avg_return"]],
@@ -448,11 +510,11 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
             text=[f"{ti['tweet_day_stats']['avg_return']:+.2f}%", f"{ti['no_tweet_day_stats']['avg_return']:+.2f}%"],
             textposition="outside",
         ),
-        row=1, col=2
-    )
+        1, 2, False
+    ))
     
     # 3. Daily tweets
-    fig.add_trace(
+    panels.append((
         go.Bar(
             x=merged_data["date"],
             y=merged_data["tweet_count"],
@@ -460,31 +522,30 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
             opacity=0.7,
             name="Daily Tweets",
         ),
-        row=2, col=1
-    )
+        2, 1, False
+    ))
     
     # 4. Quiet periods impact
     quiet_periods = [qp for qp in report["quiet_periods"] if qp.get("price_change_during") is not None]
-    quiet_periods.sort(key=lambda x: x["gap_days"], reverse=True)
-    top_quiet = quiet_periods[:8]
+    top_quiet = heapq.nlargest(8, quiet_periods, key=lambda x: x["gap_days"])
     
     if top_quiet:
         labels = [f"{qp['gap_days']}d" for qp in top_quiet]
         changes = [qp["price_change_during"] for qp in top_quiet]
         colors = ["#FF6B6B" if c < 0 else "#00D4AA" for c in changes]
         
-        fig.add_trace(
+        panels.append((
             go.Bar(
                 x=labels,
                 y=changes,
                 marker_color=colors,
                 name="Price Impact",
             ),
-            row=2, col=2
-        )
+            2, 2, False
+        ))
     
     # 5. Scatter plot
-    fig.add_trace(
+    panels.append((
         go.Scatter(
             x=merged_data["tweets_7d_sum"],
             y=merged_data["close"],
@@ -492,8 +553,8 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
             marker=dict(size=6, color="#00D4AA", opacity=0.6),
             name="Data Points",
         ),
-        row=3, col=1
-    )
+        3, 1, False
+    ))
     
     # 6. Stats table
     corr = report["correlations"]
@@ -502,11 +563,11 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
         ["Correlation (7d tweets vs price)", f"{corr.get('tweets_7d_avg_vs_price', {}).get('correlation', 0):.3f}"],
         ["Tweet day avg return", f"{ti['tweet_day_stats']['avg_return']:+.2f}%"],
         ["No-tweet day avg return", f"{ti['no_tweet_day_stats']['avg_return']:+.2f}%"],
-        ["Current silence", f"{quiet_periods[0]['gap_days'] if quiet_periods and quiet_periods[0].get('is_current') else 'N/A'} days"],
-        ["Current silence impact", f"{quiet_periods[0].get('price_change_during', 0):.1f}%" if quiet_periods else "N/A"],
+        ["Current silence", f"{top_quiet[0]['gap_days'] if top_quiet and top_quiet[0].get('is_current') else 'N/A'} days"],
+        ["Current silence impact", f"{top_quiet[0].get('price_change_during', 0):.1f}%" if top_quiet else "N/A"],
     ]
     
-    fig.add_trace(
+    panels.append((
         go.Table(
             header=dict(
                 values=["Metric", "Value"],
@@ -521,7 +582,15 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
                 align="left",
             ),
         ),
-        row=3, col=2
+        3, 2, False
+    ))
+    
+    traces, rows, cols, secondary_ys = zip(*panels)
+    fig.add_traces(
+        list(traces),
+        rows=list(rows),
+        cols=list(cols),
+        secondary_ys=list(secondary_ys),
     )
     
     fig.update_layout(
@@ -530,9 +599,7 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
             font=dict(size=22, color="#FFFFFF"),
             x=0.5,
         ),
-        template="plotly_dark",
-        paper_bgcolor="#0D1117",
-        plot_bgcolor="#0D1117",
+        **BASE_LAYOUT,
         height=1000,
         showlegend=False,
     )
@@ -540,43 +607,61 @@ def create_summary_dashboard(report: Dict) -> go.Figure:
     return fig
 
 
+def write_combined_html(figures: List[go.Figure], path: Path):
+    """
+    Write every figure into one page as div fragments, loading plotly.js
+    from the CDN once instead of once per file.
+    """
+    fragments = [
+        fig.to_html(
+            full_html=False,
+            include_plotlyjs="cdn" if i == 0 else False,
+            validate=False,
+        )
+        for i, fig in enumerate(figures)
+    ]
+    body = "\n".join(fragments)
+    path.write_text(
+        "<html>\n<head><meta charset=\"utf-8\" /></head>\n"
+        f"<body style=\"background-color: #0D1117;\">\n{body}\n</body>\n</html>\n",
+        encoding="utf-8",
+    )
+
+
 def main():
     """Generate all visualizations."""
+    parser = argparse.ArgumentParser(description="Generate the tweet-price visualizations")
+    parser.add_argument("--standalone", action="store_true", help="Also write each chart to its own HTML file")
+    args = parser.parse_args()
+    
     print("Loading analysis report...")
     report = load_analysis_report()
+    merged_data = build_merged_frame(report)
     
     print("Generating visualizations...")
     
-    # Main chart
-    fig1 = create_dual_axis_chart(report)
-    fig1.write_html(OUTPUT_DIR / "price_vs_tweets.html")
-    print(f"  ✓ Saved: price_vs_tweets.html")
-    
-    # Comparison chart
-    fig2 = create_comparison_chart(report)
-    fig2.write_html(OUTPUT_DIR / "tweet_day_comparison.html")
-    print(f"  ✓ Saved: tweet_day_comparison.html")
-    
-    # Quiet period chart
-    fig3 = create_quiet_period_chart(report)
-    if fig3:
-        fig3.write_html(OUTPUT_DIR / "quiet_periods.html")
-        print(f"  ✓ Saved: quiet_periods.html")
-    
-    # Scatter plot
-    fig4 = create_correlation_scatter(report)
-    fig4.write_html(OUTPUT_DIR / "correlation_scatter.html")
-    print(f"  ✓ Saved: correlation_scatter.html")
-    
-    # Dashboard
-    fig5 = create_summary_dashboard(report)
-    fig5.write_html(OUTPUT_DIR / "dashboard.html")
+    charts = {
+        "price_vs_tweets.html": create_dual_axis_chart(report, merged_data),
+        "tweet_day_comparison.html": create_comparison_chart(report),
+        # None when no quiet period has price data
+        "quiet_periods.html": create_quiet_period_chart(report),
+        "correlation_scatter.html": create_correlation_scatter(report, merged_data),
+        "summary_dashboard.html": create_summary_dashboard(report, merged_data),
+    }
+    charts = {name: fig for name, fig in charts.items() if fig is not None}
+    
+    if args.standalone:
+        for name, fig in charts.items():
+            fig.write_html(OUTPUT_DIR / name, **WRITE_HTML_OPTIONS)
+            print(f"  ✓ Saved: {name}")
+    
+    # All charts on one page
+    write_combined_html(list(charts.values()), OUTPUT_DIR / "dashboard.html")
     print(f"  ✓ Saved: dashboard.html")
     
     print(f"\n🎉 All visualizations saved to: {OUTPUT_DIR}")
-    print("\nOpen any .html file in your browser to view the interactive charts!")
+    print("\nOpen dashboard.html in your browser to view the interactive charts!")
 
 
 if __name__ == "__main__":
     main()
-
@@ -3,28 +3,48 @@
 Where are the tails? What creates the extreme events?
 """
 
-import json
+import heapq
+import os
 from pathlib import Path
 from collections import Counter
-import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Falls back to the stdlib parser, which accepts the same bytes
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+# Numba is optional: without it buckets are counted with searchsorted
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-# Load all tweets
 STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
 
-all_events = []
-for asset_dir in STATIC_DIR.iterdir():
-    if not asset_dir.is_dir():
-        continue
-    tweet_file = asset_dir / "tweet_events.json"
-    if tweet_file.exists():
-        with open(tweet_file) as f:
-            data = json.load(f)
-            for event in data.get("events", []):
-                event["asset"] = asset_dir.name
-                all_events.append(event)
-
-# Get all 24h changes
-changes = [e["change_24h_pct"] for e in all_events if e.get("change_24h_pct") is not None]
+# Load all tweets, reading and parsing the per-asset files on a thread pool
+def load_asset_events(asset_dir):
+    tweet_file = Path(asset_dir.path) / "tweet_events.json"
+    if not tweet_file.exists():
+        return []
+    events = orjson.loads(tweet_file.read_bytes()).get("events", [])
+    for event in events:
+        event["asset"] = asset_dir.name
+    return events
+
+asset_dirs = [d for d in os.scandir(STATIC_DIR) if d.is_dir()]
+with ThreadPoolExecutor(max_workers=16) as pool:
+    all_events = [e for events in pool.map(load_asset_events, asset_dirs) for e in events]
+
+# Get all 24h changes (one float64 array reused by every stat below)
+changes = np.fromiter(
+    (e["change_24h_pct"] for e in all_events if e.get("change_24h_pct") is not None),
+    dtype=np.float64,
+)
 
 print("=" * 70)
 print("DISTRIBUTION OF 24H CHANGES AFTER FOUNDER TWEETS")
@@ -34,52 +54,56 @@ print()
 
 # Basic stats
 print("Basic Statistics:")
-print(f"  Mean:   {statistics.mean(changes):+.2f}%")
-print(f"  Median: {statistics.median(changes):+.2f}%")
-print(f"  StdDev: {statistics.stdev(changes):.2f}%")
+print(f"  Mean:   {changes.mean():+.2f}%")
+print(f"  Median: {np.median(changes):+.2f}%")
+print(f"  StdDev: {changes.std(ddof=1):.2f}%")
 print()
 
-# Percentiles
-sorted_changes = sorted(changes)
-n = len(sorted_changes)
-percentiles = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+# Percentiles: nearest-rank index min(int(n * p / 100), n - 1), all nine
+# selected in one np.partition pass instead of a full sort
+n = len(changes)
+percentiles = np.array([1, 5, 10, 25, 50, 75, 90, 95, 99])
+idxs = np.minimum(n * percentiles // 100, n - 1)
+percentile_vals = np.partition(changes, idxs)[idxs]
 print("Percentiles:")
-for p in percentiles:
-    idx = int(n * p / 100)
-    val = sorted_changes[min(idx, n-1)]
+for p, val in zip(percentiles, percentile_vals):
     print(f"  {p:>2}th percentile: {val:+.2f}%")
 print()
 
 # Bucket distribution
 print("Distribution by bucket:")
-buckets = {
-    "< -20%": 0,
-    "-20% to -10%": 0,
-    "-10% to -5%": 0,
-    "-5% to 0%": 0,
-    "0% to 5%": 0,
-    "5% to 10%": 0,
-    "10% to 20%": 0,
-    "> 20%": 0,
-}
-
-for c in changes:
-    if c < -20:
-        buckets["< -20%"] += 1
-    elif c < -10:
-        buckets["-20% to -10%"] += 1
-    elif c < -5:
-        buckets["-10% to -5%"] += 1
-    elif c < 0:
-        buckets["-5% to 0%"] += 1
-    elif c < 5:
-        buckets["0% to 5%"] += 1
-    elif c < 10:
-        buckets["5% to 10%"] += 1
-    elif c < 20:
-        buckets["10% to 20%"] += 1
-    else:
-        buckets["> 20%"] += 1
+bucket_labels = [
+    "< -20%",
+    "-20% to -10%",
+    "-10% to -5%",
+    "-5% to 0%",
+    "0% to 5%",
+    "5% to 10%",
+    "10% to 20%",
+    "> 20%",
+]
+# Inner edges of half-open [lo, hi) bins, so e.g. exactly -20 lands in
+# "-20% to -10%"
+bucket_edges = np.array([-20, -10, -5, 0, 5, 10, 20], dtype=np.float64)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def count_buckets(values, edges):
+        counts = np.zeros(len(edges) + 1, dtype=np.int64)
+        for v in values:
+            k = 0
+            while k < len(edges) and v >= edges[k]:
+                k += 1
+            counts[k] += 1
+        return counts
+
+    bucket_counts = count_buckets(changes, bucket_edges)
+else:
+    bucket_counts = np.bincount(
+        np.searchsorted(bucket_edges, changes, side="right"),
+        minlength=len(bucket_edges) + 1,
+    )
+buckets = dict(zip(bucket_labels, bucket_counts.tolist()))
 
 total = len(changes)
 for bucket, count in buckets.items():
@@ -92,12 +116,22 @@ print("=" * 70)
 print("THE TAILS: EXTREME EVENTS")
 print("=" * 70)
 
+# Only the extremes are needed, so heap-select them instead of sorting
+# every event
+def change_key(e):
+    return e.get("change_24h_pct") or 0
+
+top_20_pumps = heapq.nlargest(20, all_events, key=change_key)
+# Biggest dumps first, i.e. the reversed tail of a descending sort; that
+# tail keeps the later-loaded of tied events, latest first, which
+# nsmallest over the reversed list reproduces
+bottom_20 = heapq.nsmallest(20, reversed(all_events), key=change_key)
+
 # Top 15 biggest pumps
-sorted_by_change = sorted(all_events, key=lambda e: e.get("change_24h_pct") or 0, reverse=True)
 
 print("\nTOP 15 BIGGEST PUMPS (24h after tweet):")
 print("-" * 70)
-for i, e in enumerate(sorted_by_change[:15]):
+for i, e in enumerate(top_20_pumps[:15]):
     change = e.get("change_24h_pct", 0)
     mcap = e.get("market_cap_at_tweet", 0)
     mcap_str = f"${mcap/1e6:.0f}M" if mcap else "N/A"
@@ -108,7 +142,7 @@ for i, e in enumerate(sorted_by_change[:15]):
 # Top 15 biggest dumps
 print("\nTOP 15 BIGGEST DUMPS (24h after tweet):")
 print("-" * 70)
-for i, e in enumerate(sorted_by_change[-15:][::-1]):
+for i, e in enumerate(bottom_20[:15]):
     change = e.get("change_24h_pct", 0)
     mcap = e.get("market_cap_at_tweet", 0)
     mcap_str = f"${mcap/1e6:.0f}M" if mcap else "N/A"
@@ -122,8 +156,7 @@ print("=" * 70)
 print("WHAT DO THE EXTREMES HAVE IN COMMON?")
 print("=" * 70)
 
-top_20_pumps = sorted_by_change[:20]
-top_20_dumps = sorted_by_change[-20:]
+top_20_dumps = bottom_20[::-1]
 
 # Asset concentration
 print("\nAsset concentration in top 20 pumps:")
@@ -137,11 +170,17 @@ for asset, count in dump_assets.most_common():
     print(f"  {asset}: {count}")
 
 # Market cap comparison
-pump_mcaps = [e.get("market_cap_at_tweet", 0) for e in top_20_pumps if e.get("market_cap_at_tweet")]
-dump_mcaps = [e.get("market_cap_at_tweet", 0) for e in top_20_dumps if e.get("market_cap_at_tweet")]
-all_mcaps = [e.get("market_cap_at_tweet", 0) for e in all_events if e.get("market_cap_at_tweet")]
+def mcaps(events):
+    return np.fromiter(
+        (e["market_cap_at_tweet"] for e in events if e.get("market_cap_at_tweet")),
+        dtype=np.float64,
+    )
+
+pump_mcaps = mcaps(top_20_pumps)
+dump_mcaps = mcaps(top_20_dumps)
+all_mcaps = mcaps(all_events)
 
 print(f"\nAverage market cap:")
-print(f"  Top 20 pumps: ${statistics.mean(pump_mcaps)/1e6:.0f}M")
-print(f"  Top 20 dumps: ${statistics.mean(dump_mcaps)/1e6:.0f}M")
-print(f"  All tweets:   ${statistics.mean(all_mcaps)/1e6:.0f}M")
+print(f"  Top 20 pumps: ${pump_mcaps.mean()/1e6:.0f}M")
+print(f"  Top 20 dumps: ${dump_mcaps.mean()/1e6:.0f}M")
+print(f"  All tweets:   ${all_mcaps.mean()/1e6:.0f}M")
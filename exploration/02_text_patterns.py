@@ -3,62 +3,66 @@
 Are there keyword patterns that predict outcomes?
 """
 
-import json
+import os
 import re
 from pathlib import Path
 from collections import Counter
-import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# orjson is optional: stdlib json parses the same bytes, just slower
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
 
-# Load all tweets
-all_events = []
-for asset_dir in STATIC_DIR.iterdir():
-    if not asset_dir.is_dir():
-        continue
-    tweet_file = asset_dir / "tweet_events.json"
-    if tweet_file.exists():
-        with open(tweet_file) as f:
-            data = json.load(f)
-            for event in data.get("events", []):
-                event["asset"] = asset_dir.name
-                all_events.append(event)
-
-# Filter to those with price data
-events = [e for e in all_events if e.get("change_24h_pct") is not None]
+# Load tweets with price data, reading and parsing the per-asset files on a
+# thread pool; unpriced events are dropped while each file is parsed
+def load_asset_events(asset_dir):
+    tweet_file = Path(asset_dir.path) / "tweet_events.json"
+    if not tweet_file.exists():
+        return []
+    events = []
+    for event in orjson.loads(tweet_file.read_bytes()).get("events", []):
+        if event.get("change_24h_pct") is not None:
+            event["asset"] = asset_dir.name
+            events.append(event)
+    return events
+
+asset_dirs = [d for d in os.scandir(STATIC_DIR) if d.is_dir()]
+with ThreadPoolExecutor(max_workers=16) as pool:
+    events = [e for asset_events in pool.map(load_asset_events, asset_dirs) for e in asset_events]
+changes_24h = np.fromiter((e["change_24h_pct"] for e in events), dtype=np.float64, count=len(events))
+
+# Outcome stats computed per group in one groupby sweep
+OUTCOME_AGGS = dict(
+    avg="mean",
+    med="median",
+    win=lambda s: (s > 0).mean() * 100,
+    n="count",
+)
 
 print("=" * 70)
 print("TEXT PATTERN ANALYSIS")
 print("=" * 70)
 
-# Tweet length analysis
-def get_length_bucket(text):
-    length = len(text)
-    if length < 50:
-        return "short (<50)"
-    elif length < 150:
-        return "medium (50-150)"
-    elif length < 280:
-        return "long (150-280)"
-    else:
-        return "thread (280+)"
-
-length_buckets = {}
-for e in events:
-    bucket = get_length_bucket(e.get("text", ""))
-    if bucket not in length_buckets:
-        length_buckets[bucket] = []
-    length_buckets[bucket].append(e["change_24h_pct"])
+# Tweet length analysis: half-open [lo, hi) buckets
+length_labels = ["short (<50)", "medium (50-150)", "long (150-280)", "thread (280+)"]
+text_lens = np.fromiter((len(e.get("text", "")) for e in events), dtype=np.int64, count=len(events))
+length_df = pd.DataFrame({
+    "change": changes_24h,
+    "len_bucket": pd.cut(text_lens, bins=[0, 50, 150, 280, np.inf], labels=length_labels, right=False),
+})
+length_stats = length_df.groupby("len_bucket", observed=True)["change"].agg(**OUTCOME_AGGS)
 
 print("\nTweet Length vs Outcome:")
 print("-" * 70)
-for bucket in ["short (<50)", "medium (50-150)", "long (150-280)", "thread (280+)"]:
-    if bucket in length_buckets:
-        changes = length_buckets[bucket]
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        print(f"  {bucket:>20}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={len(changes)}")
+for bucket, avg, med, wins, n in length_stats.itertuples():
+    print(f"  {bucket:>20}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={n}")
 
 # Emoji-only tweets
 def is_emoji_only(text):
@@ -66,26 +70,19 @@ def is_emoji_only(text):
     cleaned = re.sub(r'[\s\u200d]', '', text)
     if len(cleaned) < 3:
         return True
-    # Check if text is mostly non-ASCII (emojis)
-    non_ascii = sum(1 for c in cleaned if ord(c) > 127)
+    # Check if text is mostly non-ASCII (emojis); the ASCII codec drops every
+    # non-ASCII char in C, so the length difference is the non-ASCII count
+    non_ascii = len(cleaned) - len(cleaned.encode("ascii", "ignore"))
     return non_ascii / len(cleaned) > 0.7
 
-emoji_tweets = [e for e in events if is_emoji_only(e.get("text", ""))]
-text_tweets = [e for e in events if not is_emoji_only(e.get("text", ""))]
-
-print(f"\nEmoji-only tweets: {len(emoji_tweets)}")
-if emoji_tweets:
-    changes = [e["change_24h_pct"] for e in emoji_tweets]
-    print(f"  Avg: {statistics.mean(changes):+.2f}%")
-    print(f"  Med: {statistics.median(changes):+.2f}%")
-    print(f"  Win rate: {sum(1 for c in changes if c > 0) / len(changes) * 100:.1f}%")
+emoji_flags = np.fromiter((is_emoji_only(e.get("text", "")) for e in events), dtype=bool, count=len(events))
 
-print(f"\nText tweets: {len(text_tweets)}")
-if text_tweets:
-    changes = [e["change_24h_pct"] for e in text_tweets]
-    print(f"  Avg: {statistics.mean(changes):+.2f}%")
-    print(f"  Med: {statistics.median(changes):+.2f}%")
-    print(f"  Win rate: {sum(1 for c in changes if c > 0) / len(changes) * 100:.1f}%")
+for label, changes in (("Emoji-only", changes_24h[emoji_flags]), ("Text", changes_24h[~emoji_flags])):
+    print(f"\n{label} tweets: {len(changes)}")
+    if len(changes):
+        print(f"  Avg: {changes.mean():+.2f}%")
+        print(f"  Med: {np.median(changes):+.2f}%")
+        print(f"  Win rate: {(changes > 0).mean() * 100:.1f}%")
 
 # Keyword analysis
 print("\n" + "=" * 70)
@@ -106,62 +103,76 @@ keywords = {
 print("\nKeyword presence vs outcome:")
 print("-" * 70)
 
-for category, words in keywords.items():
-    matching = []
-    for e in events:
-        text = e.get("text", "").lower()
-        if any(w.lower() in text for w in words):
-            matching.append(e)
+# Lowercase every text once, and fold each category's keywords into one
+# compiled alternation so a tweet is scanned once per category rather than
+# once per keyword (same plain-substring semantics as `w in text`)
+lowered_texts = [e.get("text", "").lower() for e in events]
+keyword_patterns = {
+    category: re.compile("|".join(re.escape(w.lower()) for w in words))
+    for category, words in keywords.items()
+}
 
-    if len(matching) >= 10:
-        changes = [e["change_24h_pct"] for e in matching]
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        print(f"  {category:>15}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={len(matching)}")
+# flags[i, k] is True when tweet i matches category k; one row per
+# (tweet, category) hit then feeds the same groupby as the length buckets
+flags = np.array(
+    [[bool(pattern.search(text)) for pattern in keyword_patterns.values()] for text in lowered_texts],
+    dtype=bool,
+).reshape(len(events), len(keyword_patterns))
+hit_rows, hit_cats = np.nonzero(flags)
+keyword_df = pd.DataFrame({
+    "category": pd.Categorical.from_codes(hit_cats, categories=list(keyword_patterns)),
+    "change": changes_24h[hit_rows],
+})
+keyword_stats = keyword_df.groupby("category", observed=True)["change"].agg(**OUTCOME_AGGS)
+
+for category, avg, med, wins, n in keyword_stats.itertuples():
+    if n >= 10:
+        print(f"  {category:>15}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={n}")
 
 # Top words in pumps vs dumps
 print("\n" + "=" * 70)
 print("WORD FREQUENCY IN EXTREMES")
 print("=" * 70)
 
+URL_RE = re.compile(r'http\S+')
+MENTION_RE = re.compile(r'@\S+')
+# Runs of 3+ word chars == punctuation->space, split, len > 2 filter
+WORD_RE = re.compile(r'\w{3,}')
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either', 'neither',
+    'not', 'only', 'own', 'same', 'than', 'too', 'very', 'just', 'also',
+    'it', 'its', 'this', 'that', 'these', 'those', 'i', 'me', 'my', 'we',
+    'our', 'you', 'your', 'he', 'him', 'his', 'she', 'her', 'they', 'them',
+    'their', 'what', 'which', 'who', 'whom', 'when', 'where', 'why', 'how',
+    'all', 'each', 'every', 'any', 'some', 'no', 'if', 'up', 'out', 'about',
+})
+
 def get_words(text):
-    # Simple tokenization
-    text = text.lower()
-    text = re.sub(r'http\S+', '', text)  # Remove URLs
-    text = re.sub(r'@\S+', '', text)  # Remove mentions
-    text = re.sub(r'[^\w\s]', ' ', text)  # Remove punctuation
-    words = text.split()
+    # Simple tokenization; text is already lowercased
+    text = URL_RE.sub('', text)  # Remove URLs
+    text = MENTION_RE.sub('', text)  # Remove mentions
     # Filter short words and common words
-    stopwords = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                 'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-                 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
-                 'into', 'through', 'during', 'before', 'after', 'above', 'below',
-                 'and', 'but', 'or', 'nor', 'so', 'yet', 'both', 'either', 'neither',
-                 'not', 'only', 'own', 'same', 'than', 'too', 'very', 'just', 'also',
-                 'it', 'its', 'this', 'that', 'these', 'those', 'i', 'me', 'my', 'we',
-                 'our', 'you', 'your', 'he', 'him', 'his', 'she', 'her', 'they', 'them',
-                 'their', 'what', 'which', 'who', 'whom', 'when', 'where', 'why', 'how',
-                 'all', 'each', 'every', 'any', 'some', 'no', 'if', 'up', 'out', 'about'}
-    return [w for w in words if len(w) > 2 and w not in stopwords]
-
-sorted_events = sorted(events, key=lambda e: e.get("change_24h_pct", 0), reverse=True)
-top_50_pumps = sorted_events[:50]
-top_50_dumps = sorted_events[-50:]
-middle_events = sorted_events[len(sorted_events)//2 - 50 : len(sorted_events)//2 + 50]
-
-pump_words = Counter()
-for e in top_50_pumps:
-    pump_words.update(get_words(e.get("text", "")))
-
-dump_words = Counter()
-for e in top_50_dumps:
-    dump_words.update(get_words(e.get("text", "")))
-
-middle_words = Counter()
-for e in middle_events:
-    middle_words.update(get_words(e.get("text", "")))
+    return [w for w in WORD_RE.findall(text) if w not in STOPWORDS]
+
+# Rank the lowercased texts from the keyword scan by the precomputed change
+# array (stable on -change, so ties keep load order like sorted(reverse=True))
+ranked_texts = [lowered_texts[i] for i in np.argsort(-changes_24h, kind="stable")]
+top_50_pumps = ranked_texts[:50]
+top_50_dumps = ranked_texts[-50:]
+middle_texts = ranked_texts[len(ranked_texts)//2 - 50 : len(ranked_texts)//2 + 50]
+
+def count_words(texts):
+    # One Counter build over a flat token stream instead of per-tweet updates
+    return Counter(w for text in texts for w in get_words(text))
+
+pump_words = count_words(top_50_pumps)
+dump_words = count_words(top_50_dumps)
+middle_words = count_words(middle_texts)
 
 print("\nTop 15 words in PUMP tweets (top 50):")
 for word, count in pump_words.most_common(15):
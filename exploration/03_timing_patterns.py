@@ -3,208 +3,131 @@
 Day of week, time of day, sequence effects
 """
 
-import json
-from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
-import statistics
-
-STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
-
-# Load all tweets
-all_events = []
-for asset_dir in STATIC_DIR.iterdir():
-    if not asset_dir.is_dir():
-        continue
-    tweet_file = asset_dir / "tweet_events.json"
-    if tweet_file.exists():
-        with open(tweet_file) as f:
-            data = json.load(f)
-            for event in data.get("events", []):
-                event["asset"] = asset_dir.name
-                all_events.append(event)
-
-# Filter to those with price data
-events = [e for e in all_events if e.get("change_24h_pct") is not None]
-
-print("=" * 70)
-print("TIMING PATTERN ANALYSIS")
-print("=" * 70)
-
-# Parse timestamps
-for e in events:
-    dt = datetime.fromisoformat(e["timestamp_iso"].replace("Z", "+00:00"))
-    e["hour"] = dt.hour
-    e["day_of_week"] = dt.weekday()  # 0=Monday, 6=Sunday
-    e["day_name"] = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][dt.weekday()]
+import sys
+
+import numpy as np
+
+from load_data import load_events_enriched, outcome, bucket_stats
+
+# Indexed by day_of_week (0=Monday); names are only used when printing
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Tweets with price data, plus their column arrays (cached by load_data)
+events, arrays = load_events_enriched()
+
+# Report lines are collected and written in one go at the end
+out = []
+
+out.append("=" * 70)
+out.append("TIMING PATTERN ANALYSIS")
+out.append("=" * 70)
 
 # Day of week analysis
-print("\nDay of Week:")
-print("-" * 70)
-day_buckets = defaultdict(list)
-for e in events:
-    day_buckets[e["day_name"]].append(e["change_24h_pct"])
-
-for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]:
-    changes = day_buckets[day]
-    if changes:
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        print(f"  {day}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={len(changes)}")
+out.append("\nDay of Week:")
+out.append("-" * 70)
+day_stats = bucket_stats(arrays.day_of_week, arrays.change_24h, len(DAY_NAMES))
+
+for day, n, avg, med, wins in zip(DAY_NAMES, *day_stats):
+    if n:
+        out.append(f"  {day}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={n}")
 
 # Weekday vs Weekend
-weekday = [e["change_24h_pct"] for e in events if e["day_of_week"] < 5]
-weekend = [e["change_24h_pct"] for e in events if e["day_of_week"] >= 5]
+is_weekend = arrays.day_of_week >= 5
+weekday = arrays.change_24h[~is_weekend]
+weekend = arrays.change_24h[is_weekend]
 
-print(f"\nWeekday vs Weekend:")
-print(f"  Weekday: avg {statistics.mean(weekday):+.2f}%, med {statistics.median(weekday):+.2f}%, win {sum(1 for c in weekday if c > 0)/len(weekday)*100:.1f}%, n={len(weekday)}")
-print(f"  Weekend: avg {statistics.mean(weekend):+.2f}%, med {statistics.median(weekend):+.2f}%, win {sum(1 for c in weekend if c > 0)/len(weekend)*100:.1f}%, n={len(weekend)}")
+out.append(f"\nWeekday vs Weekend:")
+for label, changes in (("Weekday", weekday), ("Weekend", weekend)):
+    avg, med, wins = outcome(changes)
+    out.append(f"  {label}: avg {avg:+.2f}%, med {med:+.2f}%, win {wins:.1f}%, n={len(changes)}")
 
 # Hour of day analysis (UTC)
-print("\n" + "=" * 70)
-print("Hour of Day (UTC):")
-print("-" * 70)
-hour_buckets = defaultdict(list)
-for e in events:
-    hour_buckets[e["hour"]].append(e["change_24h_pct"])
+out.append("\n" + "=" * 70)
+out.append("Hour of Day (UTC):")
+out.append("-" * 70)
+hour_n, hour_avg, hour_med, hour_win = bucket_stats(arrays.hour, arrays.change_24h, 24)
 
 for hour in range(24):
-    changes = hour_buckets[hour]
-    if len(changes) >= 20:  # Only show hours with enough data
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        bar = "█" * int(wins / 5)
-        print(f"  {hour:02d}:00: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}% {bar} n={len(changes)}")
-
-# Best and worst hours
-print("\nBest 3 hours:")
-sorted_hours = sorted(hour_buckets.items(), key=lambda x: statistics.median(x[1]) if len(x[1]) >= 20 else -100, reverse=True)
-for hour, changes in sorted_hours[:3]:
-    if len(changes) >= 20:
-        print(f"  {hour:02d}:00 UTC: median {statistics.median(changes):+.2f}%")
-
-print("\nWorst 3 hours:")
-for hour, changes in sorted_hours[-3:]:
-    if len(changes) >= 20:
-        print(f"  {hour:02d}:00 UTC: median {statistics.median(changes):+.2f}%")
+    if hour_n[hour] >= 20:  # Only show hours with enough data
+        bar = "█" * int(hour_win[hour] / 5)
+        out.append(f"  {hour:02d}:00: avg {hour_avg[hour]:+6.2f}%, med {hour_med[hour]:+6.2f}%, win {hour_win[hour]:5.1f}% {bar} n={hour_n[hour]}")
+
+# Best and worst hours. All 24 hours are ranked, in the order they first
+# appear in the data (unseen hours last, ascending); hours under 20 tweets
+# sort to the bottom with a -100 sentinel and are skipped when printing,
+# so "Worst 3" lists fewer rows when such hours exist
+seen_hours, first_seen = np.unique(arrays.hour, return_index=True)
+hour_order = seen_hours[np.argsort(first_seen)].tolist()
+hour_order += [h for h in range(24) if h not in hour_order]
+sorted_hours = sorted(hour_order, key=lambda h: hour_med[h] if hour_n[h] >= 20 else -100, reverse=True)
+
+out.append("\nBest 3 hours:")
+for hour in sorted_hours[:3]:
+    if hour_n[hour] >= 20:
+        out.append(f"  {hour:02d}:00 UTC: median {hour_med[hour]:+.2f}%")
+
+out.append("\nWorst 3 hours:")
+for hour in sorted_hours[-3:]:
+    if hour_n[hour] >= 20:
+        out.append(f"  {hour:02d}:00 UTC: median {hour_med[hour]:+.2f}%")
 
 # Sequence analysis - nth tweet from founder
-print("\n" + "=" * 70)
-print("SEQUENCE ANALYSIS")
-print("=" * 70)
-
-# Group by asset and sort by time
-asset_tweets = defaultdict(list)
-for e in events:
-    asset_tweets[e["asset"]].append(e)
-
-for asset in asset_tweets:
-    asset_tweets[asset].sort(key=lambda x: x["timestamp"])
-    for i, e in enumerate(asset_tweets[asset]):
-        e["tweet_order"] = i + 1
+out.append("\n" + "=" * 70)
+out.append("SEQUENCE ANALYSIS")
+out.append("=" * 70)
 
 # Analyze by tweet order
-print("\nTweet order (nth tweet from founder for this asset):")
-print("-" * 70)
-order_buckets = {
-    "1-5 (early)": [],
-    "6-20": [],
-    "21-50": [],
-    "51-100": [],
-    "100+": [],
-}
-
-for e in events:
-    order = e.get("tweet_order", 0)
-    if order <= 5:
-        order_buckets["1-5 (early)"].append(e["change_24h_pct"])
-    elif order <= 20:
-        order_buckets["6-20"].append(e["change_24h_pct"])
-    elif order <= 50:
-        order_buckets["21-50"].append(e["change_24h_pct"])
-    elif order <= 100:
-        order_buckets["51-100"].append(e["change_24h_pct"])
-    else:
-        order_buckets["100+"].append(e["change_24h_pct"])
-
-for bucket in ["1-5 (early)", "6-20", "21-50", "51-100", "100+"]:
-    changes = order_buckets[bucket]
-    if changes:
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        print(f"  {bucket:>12}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={len(changes)}")
+out.append("\nTweet order (nth tweet from founder for this asset):")
+out.append("-" * 70)
+# Right-closed edges: 1-5, 6-20, 21-50, 51-100, 100+
+order_labels = ["1-5 (early)", "6-20", "21-50", "51-100", "100+"]
+order_idx = np.digitize(arrays.tweet_order, [5, 20, 50, 100], right=True)
+
+for bucket, n, avg, med, wins in zip(order_labels, *bucket_stats(order_idx, arrays.change_24h, len(order_labels))):
+    if n:
+        out.append(f"  {bucket:>12}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={n}")
 
 # Gap since last tweet
-print("\n" + "=" * 70)
-print("GAP SINCE LAST TWEET")
-print("=" * 70)
-
-for asset in asset_tweets:
-    tweets = asset_tweets[asset]
-    for i, e in enumerate(tweets):
-        if i == 0:
-            e["gap_hours"] = None
-        else:
-            gap_seconds = e["timestamp"] - tweets[i-1]["timestamp"]
-            e["gap_hours"] = gap_seconds / 3600
-
-gap_buckets = {
-    "< 1 hour": [],
-    "1-6 hours": [],
-    "6-24 hours": [],
-    "1-3 days": [],
-    "3-7 days": [],
-    "7+ days": [],
-}
-
-for e in events:
-    gap = e.get("gap_hours")
-    if gap is None:
-        continue
-    if gap < 1:
-        gap_buckets["< 1 hour"].append(e["change_24h_pct"])
-    elif gap < 6:
-        gap_buckets["1-6 hours"].append(e["change_24h_pct"])
-    elif gap < 24:
-        gap_buckets["6-24 hours"].append(e["change_24h_pct"])
-    elif gap < 72:
-        gap_buckets["1-3 days"].append(e["change_24h_pct"])
-    elif gap < 168:
-        gap_buckets["3-7 days"].append(e["change_24h_pct"])
-    else:
-        gap_buckets["7+ days"].append(e["change_24h_pct"])
-
-print("\nTime since last tweet:")
-print("-" * 70)
-for bucket in ["< 1 hour", "1-6 hours", "6-24 hours", "1-3 days", "3-7 days", "7+ days"]:
-    changes = gap_buckets[bucket]
-    if changes:
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        print(f"  {bucket:>12}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={len(changes)}")
+out.append("\n" + "=" * 70)
+out.append("GAP SINCE LAST TWEET")
+out.append("=" * 70)
+
+# Left-closed edges: <1h, 1-6h, 6-24h, 1-3d, 3-7d, 7d+; an asset's first
+# tweet (NaN gap) is left out
+gap_labels = ["< 1 hour", "1-6 hours", "6-24 hours", "1-3 days", "3-7 days", "7+ days"]
+has_gap = ~np.isnan(arrays.gap_hours)
+gap_idx = np.digitize(arrays.gap_hours[has_gap], [1, 6, 24, 72, 168])
+gap_stats = bucket_stats(gap_idx, arrays.change_24h[has_gap], len(gap_labels))
+
+out.append("\nTime since last tweet:")
+out.append("-" * 70)
+for bucket, n, avg, med, wins in zip(gap_labels, *gap_stats):
+    if n:
+        out.append(f"  {bucket:>12}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={n}")
 
 # First tweet after long silence (7+ days)
-print("\n" + "=" * 70)
-print("FIRST TWEET AFTER SILENCE")
-print("=" * 70)
-
-silence_tweets = [e for e in events if e.get("gap_hours") and e["gap_hours"] >= 168]  # 7+ days
-normal_tweets = [e for e in events if e.get("gap_hours") and e["gap_hours"] < 168]
-
-print(f"\nFirst tweet after 7+ day silence: {len(silence_tweets)} tweets")
-if silence_tweets:
-    changes = [e["change_24h_pct"] for e in silence_tweets]
-    print(f"  Avg: {statistics.mean(changes):+.2f}%")
-    print(f"  Med: {statistics.median(changes):+.2f}%")
-    print(f"  Win rate: {sum(1 for c in changes if c > 0) / len(changes) * 100:.1f}%")
-
-print(f"\nAll other tweets: {len(normal_tweets)} tweets")
-if normal_tweets:
-    changes = [e["change_24h_pct"] for e in normal_tweets]
-    print(f"  Avg: {statistics.mean(changes):+.2f}%")
-    print(f"  Med: {statistics.median(changes):+.2f}%")
-    print(f"  Win rate: {sum(1 for c in changes if c > 0) / len(changes) * 100:.1f}%")
+out.append("\n" + "=" * 70)
+out.append("FIRST TWEET AFTER SILENCE")
+out.append("=" * 70)
+
+# NaN (first tweet) compares False both ways; a zero gap counts as neither
+silence_tweets = arrays.change_24h[arrays.gap_hours >= 168]  # 7+ days
+normal_tweets = arrays.change_24h[(arrays.gap_hours > 0) & (arrays.gap_hours < 168)]
+
+out.append(f"\nFirst tweet after 7+ day silence: {len(silence_tweets)} tweets")
+if len(silence_tweets):
+    changes = silence_tweets
+    avg, med, wins = outcome(changes)
+    out.append(f"  Avg: {avg:+.2f}%")
+    out.append(f"  Med: {med:+.2f}%")
+    out.append(f"  Win rate: {wins:.1f}%")
+
+out.append(f"\nAll other tweets: {len(normal_tweets)} tweets")
+if len(normal_tweets):
+    changes = normal_tweets
+    avg, med, wins = outcome(changes)
+    out.append(f"  Avg: {avg:+.2f}%")
+    out.append(f"  Med: {med:+.2f}%")
+    out.append(f"  Win rate: {wins:.1f}%")
+
+sys.stdout.write("\n".join(out) + "\n")
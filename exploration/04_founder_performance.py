@@ -3,165 +3,132 @@
 Per-founder batting average, consistency, engagement correlation
 """
 
-import json
-from pathlib import Path
-from collections import defaultdict
-import statistics
-
-STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
-
-# Load all tweets
-all_events = []
-for asset_dir in STATIC_DIR.iterdir():
-    if not asset_dir.is_dir():
-        continue
-    tweet_file = asset_dir / "tweet_events.json"
-    if tweet_file.exists():
-        with open(tweet_file) as f:
-            data = json.load(f)
-            for event in data.get("events", []):
-                event["asset"] = asset_dir.name
-                all_events.append(event)
-
-events = [e for e in all_events if e.get("change_24h_pct") is not None]
-
-print("=" * 70)
-print("FOUNDER PERFORMANCE LEADERBOARD")
-print("=" * 70)
-
-# Group by founder
-founder_stats = defaultdict(list)
-for e in events:
-    founder_stats[e["founder"]].append(e)
-
-print("\nRanked by WIN RATE (min 50 tweets):")
-print("-" * 70)
-print(f"{'Founder':<20} {'Win%':>7} {'Avg':>8} {'Med':>8} {'StdDev':>8} {'N':>6}")
-print("-" * 70)
+import heapq
+import sys
+
+import numpy as np
+import pandas as pd
+
+from load_data import load_events_enriched, outcome, bucket_stats
+
+# Tweets with price data, plus their column arrays (cached by load_data)
+events, arrays = load_events_enriched()
+
+# Report lines are collected and written in one go at the end
+out = []
+
+out.append("=" * 70)
+out.append("FOUNDER PERFORMANCE LEADERBOARD")
+out.append("=" * 70)
+
+# Group by founder: each founder's event indices, in load order
+founder_rows = {founder: np.flatnonzero(arrays.founder_idx == code) for code, founder in enumerate(arrays.founders)}
+
+out.append("\nRanked by WIN RATE (min 50 tweets):")
+out.append("-" * 70)
+out.append(f"{'Founder':<20} {'Win%':>7} {'Avg':>8} {'Med':>8} {'StdDev':>8} {'N':>6}")
+out.append("-" * 70)
 
 founder_rankings = []
-for founder, tweets in founder_stats.items():
-    if len(tweets) >= 50:
-        changes = [t["change_24h_pct"] for t in tweets]
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        std = statistics.stdev(changes)
+for founder, rows in founder_rows.items():
+    if len(rows) >= 50:
+        changes = arrays.change_24h[rows]
+        avg, med, wins = outcome(changes)
+        std = changes.std(ddof=1)
         founder_rankings.append({
             "founder": founder,
             "win_rate": wins,
             "avg": avg,
             "med": med,
             "std": std,
-            "n": len(tweets),
-            "asset": tweets[0]["asset"],
+            "n": len(rows),
+            "asset": arrays.assets[arrays.asset_idx[rows[0]]],
         })
 
 # Sort by win rate
 founder_rankings.sort(key=lambda x: x["win_rate"], reverse=True)
 for f in founder_rankings:
-    print(f"{f['founder']:<20} {f['win_rate']:>6.1f}% {f['avg']:>+7.2f}% {f['med']:>+7.2f}% {f['std']:>7.2f}% {f['n']:>6}")
+    out.append(f"{f['founder']:<20} {f['win_rate']:>6.1f}% {f['avg']:>+7.2f}% {f['med']:>+7.2f}% {f['std']:>7.2f}% {f['n']:>6}")
 
-print("\n" + "=" * 70)
-print("CONSISTENCY RANKING (lowest stdev = most predictable)")
-print("-" * 70)
+out.append("\n" + "=" * 70)
+out.append("CONSISTENCY RANKING (lowest stdev = most predictable)")
+out.append("-" * 70)
 founder_rankings.sort(key=lambda x: x["std"])
 for f in founder_rankings[:5]:
-    print(f"{f['founder']:<20} StdDev: {f['std']:>6.2f}% | Win: {f['win_rate']:.1f}% | N={f['n']}")
+    out.append(f"{f['founder']:<20} StdDev: {f['std']:>6.2f}% | Win: {f['win_rate']:.1f}% | N={f['n']}")
 
-print("\nMost volatile founders:")
+out.append("\nMost volatile founders:")
 for f in founder_rankings[-5:]:
-    print(f"{f['founder']:<20} StdDev: {f['std']:>6.2f}% | Win: {f['win_rate']:.1f}% | N={f['n']}")
+    out.append(f"{f['founder']:<20} StdDev: {f['std']:>6.2f}% | Win: {f['win_rate']:.1f}% | N={f['n']}")
 
 # Engagement analysis
-print("\n" + "=" * 70)
-print("ENGAGEMENT VS OUTCOME")
-print("=" * 70)
-
-# Get engagement percentiles for each founder
-for founder, tweets in founder_stats.items():
-    if len(tweets) < 50:
-        continue
-
-    likes = [t.get("likes", 0) for t in tweets]
-    median_likes = statistics.median(likes)
+out.append("\n" + "=" * 70)
+out.append("ENGAGEMENT VS OUTCOME")
+out.append("=" * 70)
 
-    for t in tweets:
-        t["high_engagement"] = t.get("likes", 0) > median_likes
+# Each tweet's likes against its founder's median, in one groupby; only
+# founders with 50+ tweets take part
+likes_by_founder = pd.Series(arrays.likes).groupby(arrays.founder_idx)
+eligible = (likes_by_founder.transform("size") >= 50).to_numpy()
+above_median = (arrays.likes > likes_by_founder.transform("median")).to_numpy()
 
 # Compare high vs low engagement
-high_eng = [e for e in events if e.get("high_engagement") == True]
-low_eng = [e for e in events if e.get("high_engagement") == False]
-
-if high_eng and low_eng:
-    print("\nHigh engagement (above founder's median likes):")
-    changes = [e["change_24h_pct"] for e in high_eng]
-    print(f"  Avg: {statistics.mean(changes):+.2f}%")
-    print(f"  Med: {statistics.median(changes):+.2f}%")
-    print(f"  Win rate: {sum(1 for c in changes if c > 0) / len(changes) * 100:.1f}%")
-    print(f"  N: {len(high_eng)}")
-
-    print("\nLow engagement (below founder's median likes):")
-    changes = [e["change_24h_pct"] for e in low_eng]
-    print(f"  Avg: {statistics.mean(changes):+.2f}%")
-    print(f"  Med: {statistics.median(changes):+.2f}%")
-    print(f"  Win rate: {sum(1 for c in changes if c > 0) / len(changes) * 100:.1f}%")
-    print(f"  N: {len(low_eng)}")
+high_eng = eligible & above_median
+low_eng = eligible & ~above_median
+
+if high_eng.any() and low_eng.any():
+    out.append("\nHigh engagement (above founder's median likes):")
+    avg, med, wins = outcome(arrays.change_24h[high_eng])
+    out.append(f"  Avg: {avg:+.2f}%")
+    out.append(f"  Med: {med:+.2f}%")
+    out.append(f"  Win rate: {wins:.1f}%")
+    out.append(f"  N: {high_eng.sum()}")
+
+    out.append("\nLow engagement (below founder's median likes):")
+    avg, med, wins = outcome(arrays.change_24h[low_eng])
+    out.append(f"  Avg: {avg:+.2f}%")
+    out.append(f"  Med: {med:+.2f}%")
+    out.append(f"  Win rate: {wins:.1f}%")
+    out.append(f"  N: {low_eng.sum()}")
 
 # Impressions analysis
-print("\n" + "=" * 70)
-print("IMPRESSIONS VS OUTCOME")
-print("=" * 70)
-
-# Bucket by impressions
-imp_buckets = {
-    "< 10K": [],
-    "10K-100K": [],
-    "100K-1M": [],
-    "1M+": [],
-}
-
-for e in events:
-    imp = e.get("impressions", 0)
-    if imp < 10000:
-        imp_buckets["< 10K"].append(e["change_24h_pct"])
-    elif imp < 100000:
-        imp_buckets["10K-100K"].append(e["change_24h_pct"])
-    elif imp < 1000000:
-        imp_buckets["100K-1M"].append(e["change_24h_pct"])
-    else:
-        imp_buckets["1M+"].append(e["change_24h_pct"])
-
-print("\nBy impression count:")
-for bucket in ["< 10K", "10K-100K", "100K-1M", "1M+"]:
-    changes = imp_buckets[bucket]
-    if len(changes) >= 20:
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        print(f"  {bucket:>10}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={len(changes)}")
+out.append("\n" + "=" * 70)
+out.append("IMPRESSIONS VS OUTCOME")
+out.append("=" * 70)
+
+# Bucket by impressions (left-closed edges at 10K / 100K / 1M)
+imp_labels = ["< 10K", "10K-100K", "100K-1M", "1M+"]
+imp_idx = np.digitize(arrays.impressions, [10_000, 100_000, 1_000_000])
+
+out.append("\nBy impression count:")
+for bucket, n, avg, med, wins in zip(imp_labels, *bucket_stats(imp_idx, arrays.change_24h, len(imp_labels))):
+    if n >= 20:
+        out.append(f"  {bucket:>10}: avg {avg:+6.2f}%, med {med:+6.2f}%, win {wins:5.1f}%, n={n}")
 
 # Best individual founders deep dive
-print("\n" + "=" * 70)
-print("TOP FOUNDER DEEP DIVE")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("TOP FOUNDER DEEP DIVE")
+out.append("=" * 70)
 
 # Take top 3 by win rate
-top_founders = [f["founder"] for f in sorted(founder_rankings, key=lambda x: x["win_rate"], reverse=True)[:3]]
+top_founders = [f["founder"] for f in heapq.nlargest(3, founder_rankings, key=lambda x: x["win_rate"])]
 
 for founder in top_founders:
-    tweets = founder_stats[founder]
-    print(f"\n{founder} ({len(tweets)} tweets):")
-    print("-" * 50)
-
-    # Best tweets
-    sorted_tweets = sorted(tweets, key=lambda x: x["change_24h_pct"], reverse=True)
-    print("Top 3 tweets:")
-    for t in sorted_tweets[:3]:
-        text = t.get("text", "")[:60].replace("\n", " ")
-        print(f"  {t['change_24h_pct']:+6.1f}% | \"{text}...\"")
-
-    print("Worst 3 tweets:")
-    for t in sorted_tweets[-3:]:
-        text = t.get("text", "")[:60].replace("\n", " ")
-        print(f"  {t['change_24h_pct']:+6.1f}% | \"{text}...\"")
+    rows = founder_rows[founder]
+    out.append(f"\n{founder} ({len(rows)} tweets):")
+    out.append("-" * 50)
+
+    # Best tweets; only the six printed texts are looked up in the dicts
+    out.append("Top 3 tweets:")
+    for i in heapq.nlargest(3, rows, key=lambda i: arrays.change_24h[i]):
+        text = events[i].get("text", "")[:60].replace("\n", " ")
+        out.append(f"  {arrays.change_24h[i]:+6.1f}% | \"{text}...\"")
+
+    # Tail of a descending sort: tied tweets in load order, the later ones
+    # kept at the cutoff
+    out.append("Worst 3 tweets:")
+    for i in reversed(heapq.nsmallest(3, reversed(rows), key=lambda i: arrays.change_24h[i])):
+        text = events[i].get("text", "")[:60].replace("\n", " ")
+        out.append(f"  {arrays.change_24h[i]:+6.1f}% | \"{text}...\"")
+
+sys.stdout.write("\n".join(out) + "\n")
@@ -3,157 +3,131 @@
 Stack the insights to find the highest-signal subset.
 """
 
-import json
-from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
-import statistics
-
-STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
-
-# Load all tweets
-all_events = []
-for asset_dir in STATIC_DIR.iterdir():
-    if not asset_dir.is_dir():
-        continue
-    tweet_file = asset_dir / "tweet_events.json"
-    if tweet_file.exists():
-        with open(tweet_file) as f:
-            data = json.load(f)
-            for event in data.get("events", []):
-                event["asset"] = asset_dir.name
-                all_events.append(event)
-
-events = [e for e in all_events if e.get("change_24h_pct") is not None]
-
-# Enrich events with derived fields
-for e in events:
-    dt = datetime.fromisoformat(e["timestamp_iso"].replace("Z", "+00:00"))
-    e["hour"] = dt.hour
-    e["day_of_week"] = dt.weekday()
-    e["is_weekend"] = dt.weekday() >= 5
-    e["is_short"] = len(e.get("text", "")) < 50
-    e["mcap"] = e.get("market_cap_at_tweet", 0)
-    e["is_small_cap"] = e["mcap"] < 500_000_000 if e["mcap"] else False
-
-# Group by asset for gap calculation
-asset_tweets = defaultdict(list)
-for e in events:
-    asset_tweets[e["asset"]].append(e)
-
-for asset in asset_tweets:
-    asset_tweets[asset].sort(key=lambda x: x["timestamp"])
-    for i, e in enumerate(asset_tweets[asset]):
-        if i == 0:
-            e["gap_hours"] = 0
-        else:
-            e["gap_hours"] = (e["timestamp"] - asset_tweets[asset][i-1]["timestamp"]) / 3600
-        e["is_sweet_spot_gap"] = 72 <= e["gap_hours"] <= 168  # 3-7 days
-
-# Known good founders
-good_founders = ["a1lon9", "theunipcs", "blknoiz06"]
-
-for e in events:
-    e["is_good_founder"] = e["founder"] in good_founders
-
-print("=" * 70)
-print("COMBINED FILTER ANALYSIS")
-print("=" * 70)
+import sys
+
+import numpy as np
+
+from load_data import load_events_enriched, outcome
+
+# Tweets with price data, plus their column arrays (cached by load_data)
+events, arrays = load_events_enriched()
+
+# Report lines are collected and written in one go at the end
+out = []
+
+# Known good / bad founders
+good_founders = frozenset({"a1lon9", "theunipcs", "blknoiz06"})
+bad_founders = frozenset({"mert", "keoneHD"})
+
+def founder_mask(names):
+    """Events by any of the named founders, via their integer codes."""
+    codes = np.flatnonzero(np.isin(arrays.founders, list(names)))
+    return np.isin(arrays.founder_idx, codes)
+
+# Every atomic predicate is one boolean array built from the event columns;
+# each filter below is then an AND of masks instead of another pass over
+# the events
+n_events = len(events)
+text_len = np.fromiter((len(e.get("text", "")) for e in events), dtype=np.int64, count=n_events)
+# Missing/zero market caps are NaN, which is neither small nor large
+mcap = arrays.market_cap
+# An asset's first tweet has no gap (NaN), which is never in the sweet spot
+gap_hours = arrays.gap_hours
+hour = arrays.hour
+
+is_weekend = arrays.day_of_week >= 5
+is_monday = arrays.day_of_week == 0
+is_small_cap = mcap < 500_000_000
+is_large_cap = mcap > 1_000_000_000
+is_short = text_len < 50
+is_sweet_spot_gap = (gap_hours >= 72) & (gap_hours <= 168)  # 3-7 days
+is_good_founder = founder_mask(good_founders)
+is_bad_founder = founder_mask(bad_founders)
+
+out.append("=" * 70)
+out.append("COMBINED FILTER ANALYSIS")
+out.append("=" * 70)
 
 # Define filters
 filters = {
-    "all": lambda e: True,
-    "weekend": lambda e: e["is_weekend"],
-    "small_cap (<$500M)": lambda e: e["is_small_cap"],
-    "short tweet (<50)": lambda e: e["is_short"],
-    "good founder": lambda e: e["is_good_founder"],
-    "sweet spot gap (3-7d)": lambda e: e.get("is_sweet_spot_gap", False),
-    "04:00 UTC hour": lambda e: e["hour"] == 4,
+    "all": np.ones(n_events, dtype=bool),
+    "weekend": is_weekend,
+    "small_cap (<$500M)": is_small_cap,
+    "short tweet (<50)": is_short,
+    "good founder": is_good_founder,
+    "sweet spot gap (3-7d)": is_sweet_spot_gap,
+    "04:00 UTC hour": hour == 4,
 }
 
-print("\nIndividual Filters:")
-print("-" * 70)
-print(f"{'Filter':<25} {'Win%':>7} {'Avg':>8} {'Med':>8} {'N':>7}")
-print("-" * 70)
-
-baseline_changes = [e["change_24h_pct"] for e in events]
-baseline_win = sum(1 for c in baseline_changes if c > 0) / len(baseline_changes) * 100
-
-for name, f in filters.items():
-    subset = [e for e in events if f(e)]
-    if len(subset) >= 20:
-        changes = [e["change_24h_pct"] for e in subset]
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
+out.append("\nIndividual Filters:")
+out.append("-" * 70)
+out.append(f"{'Filter':<25} {'Win%':>7} {'Avg':>8} {'Med':>8} {'N':>7}")
+out.append("-" * 70)
+
+_, _, baseline_win = outcome(arrays.change_24h)
+
+for name, mask in filters.items():
+    n = mask.sum()
+    if n >= 20:
+        avg, med, wins = outcome(arrays.change_24h[mask])
         delta = wins - baseline_win
         delta_str = f"({delta:+.1f})" if name != "all" else ""
-        print(f"{name:<25} {wins:>6.1f}% {avg:>+7.2f}% {med:>+7.2f}% {len(subset):>7} {delta_str}")
+        out.append(f"{name:<25} {wins:>6.1f}% {avg:>+7.2f}% {med:>+7.2f}% {n:>7} {delta_str}")
 
 # Combined filters
-print("\n" + "=" * 70)
-print("STACKED FILTERS")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("STACKED FILTERS")
+out.append("=" * 70)
 
 combos = [
-    ("weekend + small_cap", lambda e: e["is_weekend"] and e["is_small_cap"]),
-    ("weekend + good_founder", lambda e: e["is_weekend"] and e["is_good_founder"]),
-    ("small_cap + good_founder", lambda e: e["is_small_cap"] and e["is_good_founder"]),
-    ("small_cap + short_tweet", lambda e: e["is_small_cap"] and e["is_short"]),
-    ("weekend + small_cap + good_founder", lambda e: e["is_weekend"] and e["is_small_cap"] and e["is_good_founder"]),
-    ("weekend + small_cap + short", lambda e: e["is_weekend"] and e["is_small_cap"] and e["is_short"]),
-    ("ALL POSITIVE SIGNALS", lambda e: (
-        e["is_weekend"] and
-        e["is_small_cap"] and
-        e["is_good_founder"]
-    )),
+    ("weekend + small_cap", is_weekend & is_small_cap),
+    ("weekend + good_founder", is_weekend & is_good_founder),
+    ("small_cap + good_founder", is_small_cap & is_good_founder),
+    ("small_cap + short_tweet", is_small_cap & is_short),
+    ("weekend + small_cap + good_founder", is_weekend & is_small_cap & is_good_founder),
+    ("weekend + small_cap + short", is_weekend & is_small_cap & is_short),
+    ("ALL POSITIVE SIGNALS", is_weekend & is_small_cap & is_good_founder),
 ]
 
-print(f"\n{'Combo':<40} {'Win%':>7} {'Avg':>9} {'Med':>9} {'N':>5}")
-print("-" * 70)
-
-for name, f in combos:
-    subset = [e for e in events if f(e)]
-    if len(subset) >= 5:
-        changes = [e["change_24h_pct"] for e in subset]
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        print(f"{name:<40} {wins:>6.1f}% {avg:>+8.2f}% {med:>+8.2f}% {len(subset):>5}")
+out.append(f"\n{'Combo':<40} {'Win%':>7} {'Avg':>9} {'Med':>9} {'N':>5}")
+out.append("-" * 70)
+
+for name, mask in combos:
+    n = mask.sum()
+    if n >= 5:
+        avg, med, wins = outcome(arrays.change_24h[mask])
+        out.append(f"{name:<40} {wins:>6.1f}% {avg:>+8.2f}% {med:>+8.2f}% {n:>5}")
     else:
-        print(f"{name:<40} (n={len(subset)}, too few)")
+        out.append(f"{name:<40} (n={n}, too few)")
 
 # The "anti-signal" - what predicts dumps?
-print("\n" + "=" * 70)
-print("NEGATIVE SIGNALS (what predicts dumps?)")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("NEGATIVE SIGNALS (what predicts dumps?)")
+out.append("=" * 70)
 
 bad_filters = [
-    ("Monday", lambda e: e["day_of_week"] == 0),
-    ("large_cap (>$1B)", lambda e: e["mcap"] > 1_000_000_000 if e["mcap"] else False),
-    ("bad founders (mert, keoneHD)", lambda e: e["founder"] in ["mert", "keoneHD"]),
-    ("20:00-22:00 UTC", lambda e: 20 <= e["hour"] <= 22),
-    ("Monday + large_cap", lambda e: e["day_of_week"] == 0 and e["mcap"] > 1_000_000_000),
+    ("Monday", is_monday),
+    ("large_cap (>$1B)", is_large_cap),
+    ("bad founders (mert, keoneHD)", is_bad_founder),
+    ("20:00-22:00 UTC", (hour >= 20) & (hour <= 22)),
+    ("Monday + large_cap", is_monday & is_large_cap),
 ]
 
-print(f"\n{'Filter':<35} {'Win%':>7} {'Avg':>9} {'Med':>9} {'N':>6}")
-print("-" * 70)
+out.append(f"\n{'Filter':<35} {'Win%':>7} {'Avg':>9} {'Med':>9} {'N':>6}")
+out.append("-" * 70)
 
-for name, f in bad_filters:
-    subset = [e for e in events if f(e)]
-    if len(subset) >= 10:
-        changes = [e["change_24h_pct"] for e in subset]
-        wins = sum(1 for c in changes if c > 0) / len(changes) * 100
-        avg = statistics.mean(changes)
-        med = statistics.median(changes)
-        print(f"{name:<35} {wins:>6.1f}% {avg:>+8.2f}% {med:>+8.2f}% {len(subset):>6}")
+for name, mask in bad_filters:
+    n = mask.sum()
+    if n >= 10:
+        avg, med, wins = outcome(arrays.change_24h[mask])
+        out.append(f"{name:<35} {wins:>6.1f}% {avg:>+8.2f}% {med:>+8.2f}% {n:>6}")
 
 # Summary
-print("\n" + "=" * 70)
-print("SUMMARY: THE TRADING EDGE")
-print("=" * 70)
+out.append("\n" + "=" * 70)
+out.append("SUMMARY: THE TRADING EDGE")
+out.append("=" * 70)
 
-print("""
+out.append("""
 BASELINE: All tweets
   - 51.5% win rate, +2.48% avg
 
@@ -171,3 +145,5 @@ The edge isn't in one magic signal. It's in AVOIDING the bad setups
 (Monday, large cap, bad founders, evening UTC) and FAVORING good setups
 (weekend, small cap, proven founders, short tweets).
 """)
+
+sys.stdout.write("\n".join(out) + "\n")
@@ -3,93 +3,207 @@ Data loader for exploration - reads all tweet events from static JSON files.
 Read-only, no modifications to source data.
 """
 
-import json
+import functools
+import sys
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
-import statistics
 
-STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
+import numpy as np
+import pandas as pd
 
-@dataclass
-class TweetEvent:
-    tweet_id: str
-    asset: str
-    asset_name: str
-    founder: str
-    timestamp: int
-    timestamp_iso: str
-    text: str
-    likes: int
-    retweets: int
-    replies: int
-    impressions: int
-    price_at_tweet: Optional[float]
-    price_1h: Optional[float]
-    price_24h: Optional[float]
-    change_1h_pct: Optional[float]
-    change_24h_pct: Optional[float]
-    market_cap_at_tweet: Optional[float]
-
-def load_all_tweets() -> list[TweetEvent]:
-    """Load all tweet events from all assets."""
-    all_events = []
+from tweet_files import (
+    STATIC_DIR,
+    _read_cache,
+    _signature,
+    _tweet_files,
+    _write_cache,
+    load_tweet_files,
+)
 
-    for asset_dir in STATIC_DIR.iterdir():
-        if not asset_dir.is_dir():
-            continue
+ENRICHED_CACHE_FILE = Path(__file__).parent / ".cache" / "tweet_arrays.pkl"
 
-        tweet_file = asset_dir / "tweet_events.json"
-        if not tweet_file.exists():
-            continue
+# Per-tweet columns of load_all_tweets() and the default for events that
+# omit them (None marks missing price data and becomes NaN)
+TWEET_COLUMNS = {
+    "tweet_id": "",
+    "founder": "",
+    "timestamp": 0,
+    "timestamp_iso": "",
+    "text": "",
+    "likes": 0,
+    "retweets": 0,
+    "replies": 0,
+    "impressions": 0,
+    "price_at_tweet": None,
+    "price_1h": None,
+    "price_24h": None,
+    "change_1h_pct": None,
+    "change_24h_pct": None,
+    "market_cap_at_tweet": None,
+}
 
-        with open(tweet_file) as f:
-            data = json.load(f)
+@dataclass
+class EventArrays:
+    """Column-per-field view of tweet events, one entry per event in order."""
+    change_24h: np.ndarray   # float64
+    timestamp: np.ndarray    # int64 unix seconds
+    hour: np.ndarray         # int8, UTC
+    day_of_week: np.ndarray  # int8, 0=Monday
+    market_cap: np.ndarray   # float64, NaN when missing/zero
+    likes: np.ndarray        # int64
+    impressions: np.ndarray  # int64
+    gap_hours: np.ndarray    # float64 hours since the asset's previous tweet, NaN for its first
+    tweet_order: np.ndarray  # int64 1-based position among the asset's tweets by time
+    founder_idx: np.ndarray  # int16 index into founders
+    asset_idx: np.ndarray    # int16 index into assets
+    founders: np.ndarray     # sorted unique founder names
+    assets: np.ndarray       # sorted unique asset ids
 
+def load_raw_events() -> list[dict]:
+    """Load raw event dicts from all assets, each tagged with its "asset"."""
+    all_events = []
+    for asset, data in load_tweet_files():
         for event in data.get("events", []):
-            all_events.append(TweetEvent(
-                tweet_id=event.get("tweet_id", ""),
-                asset=asset_dir.name,
-                asset_name=event.get("asset_name", asset_dir.name),
-                founder=event.get("founder", ""),
-                timestamp=event.get("timestamp", 0),
-                timestamp_iso=event.get("timestamp_iso", ""),
-                text=event.get("text", ""),
-                likes=event.get("likes", 0),
-                retweets=event.get("retweets", 0),
-                replies=event.get("replies", 0),
-                impressions=event.get("impressions", 0),
-                price_at_tweet=event.get("price_at_tweet"),
-                price_1h=event.get("price_1h"),
-                price_24h=event.get("price_24h"),
-                change_1h_pct=event.get("change_1h_pct"),
-                change_24h_pct=event.get("change_24h_pct"),
-                market_cap_at_tweet=event.get("market_cap_at_tweet"),
-            ))
-
-    # Sort by timestamp
-    all_events.sort(key=lambda e: e.timestamp)
+            event["asset"] = asset
+            # One shared str per founder instead of one copy per tweet
+            if "founder" in event:
+                event["founder"] = sys.intern(event["founder"])
+            all_events.append(event)
+
     return all_events
 
-def summary(tweets: list[TweetEvent]) -> dict:
+@functools.lru_cache(maxsize=1)
+def load_events_enriched() -> tuple[list[dict], EventArrays]:
+    """
+    Events that have change_24h_pct, plus their EventArrays.
+
+    This is the shared starting point for the 03-05 scripts. The result is
+    memoized in-process, so a driver that runs them back to back loads
+    once, and pickled to ENRICHED_CACHE_FILE, so a fresh process skips both
+    the JSON parse and to_arrays. Callers share the returned objects and
+    must not rely on them being pristine.
+    """
+    # This module's own mtime joins the key so edits to to_arrays rebuild
+    signature = _signature(_tweet_files()) + [(__file__, Path(__file__).stat().st_mtime_ns, 0)]
+    cached = _read_cache(ENRICHED_CACHE_FILE, signature)
+    if cached is not None:
+        return cached["events"], cached["arrays"]
+
+    events = [e for e in load_raw_events() if e.get("change_24h_pct") is not None]
+    arrays = to_arrays(events)
+    _write_cache(ENRICHED_CACHE_FILE, {"signature": signature, "events": events, "arrays": arrays})
+    return events, arrays
+
+def load_all_tweets() -> pd.DataFrame:
+    """
+    Load all tweet events from all assets as one DataFrame, sorted by time.
+
+    Built from one list per column rather than an object per tweet; asset
+    and founder are categoricals, so each name is stored once.
+    """
+    raw = load_raw_events()
+    columns = {name: [e.get(name, default) for e in raw] for name, default in TWEET_COLUMNS.items()}
+    columns["asset"] = [e["asset"] for e in raw]
+    columns["asset_name"] = [e.get("asset_name", e["asset"]) for e in raw]
+
+    df = pd.DataFrame(columns)
+    df["asset"] = df["asset"].astype("category")
+    df["founder"] = df["founder"].astype("category")
+    return df.sort_values("timestamp", kind="stable", ignore_index=True)
+
+def to_arrays(events: list[dict]) -> EventArrays:
+    """Build EventArrays from raw event dicts that all have change_24h_pct."""
+    n = len(events)
+    # The integer "timestamp" carries the exporter's local UTC offset, so the
+    # UTC hour/weekday come from timestamp_iso, parsed in one numpy call
+    utc = np.array([e["timestamp_iso"].removesuffix("Z") for e in events], dtype="datetime64[s]")
+    days_since_epoch = utc.astype("datetime64[D]").astype(np.int64)
+    # Founders/assets become small integer codes; the names live once in the
+    # sorted lookup tables and are only needed again for display
+    founders, founder_idx = np.unique([e["founder"] for e in events], return_inverse=True)
+    assets, asset_idx = np.unique([e["asset"] for e in events], return_inverse=True)
+    founder_idx = founder_idx.astype(np.int16)
+    asset_idx = asset_idx.astype(np.int16)
+    timestamp = np.fromiter((e["timestamp"] for e in events), dtype=np.int64, count=n)
+
+    # Cluster by asset, then time (stable), so consecutive entries in the
+    # permutation are an asset's consecutive tweets; gaps and order both
+    # come from this one sort
+    perm = np.lexsort((timestamp, asset_idx))
+    sorted_assets = asset_idx[perm]
+    sorted_gaps = np.empty(n, dtype=np.float64)
+    sorted_gaps[1:] = np.diff(timestamp[perm]) / 3600
+    sorted_gaps[np.r_[True, sorted_assets[1:] != sorted_assets[:-1]]] = np.nan
+    gap_hours = np.empty(n, dtype=np.float64)
+    gap_hours[perm] = sorted_gaps
+    # Position within the asset's run = distance from the run's first slot
+    tweet_order = np.empty(n, dtype=np.int64)
+    tweet_order[perm] = np.arange(1, n + 1) - np.searchsorted(sorted_assets, sorted_assets)
+
+    return EventArrays(
+        change_24h=np.fromiter((e["change_24h_pct"] for e in events), dtype=np.float64, count=n),
+        timestamp=timestamp,
+        hour=(utc.astype("datetime64[h]").astype(np.int64) % 24).astype(np.int8),
+        # 1970-01-01 was a Thursday (3 with Monday=0)
+        day_of_week=((days_since_epoch + 3) % 7).astype(np.int8),
+        market_cap=np.fromiter(
+            (e.get("market_cap_at_tweet") or np.nan for e in events), dtype=np.float64, count=n
+        ),
+        likes=np.fromiter((e.get("likes", 0) for e in events), dtype=np.int64, count=n),
+        impressions=np.fromiter((e.get("impressions", 0) for e in events), dtype=np.int64, count=n),
+        gap_hours=gap_hours,
+        tweet_order=tweet_order,
+        founder_idx=founder_idx,
+        asset_idx=asset_idx,
+        founders=founders,
+        assets=assets,
+    )
+
+def outcome(changes) -> tuple[float, float, float]:
+    """(avg, med, win%) of a sequence of 24h changes."""
+    changes = np.asarray(changes, dtype=np.float64)
+    return changes.mean(), np.median(changes), (changes > 0).mean() * 100
+
+def bucket_stats(codes: np.ndarray, changes: np.ndarray, n_buckets: int):
+    """
+    Per-bucket (n, avg, med, win%) arrays for changes grouped by integer
+    codes in [0, n_buckets). One stable sort + bincount pass; empty buckets
+    get n=0 and NaN stats.
+    """
+    counts = np.bincount(codes, minlength=n_buckets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg = np.bincount(codes, weights=changes, minlength=n_buckets) / counts
+        win = np.bincount(codes, weights=changes > 0, minlength=n_buckets) / counts * 100
+
+    # Sorting by code makes each bucket a contiguous slice for the median
+    by_code = changes[np.argsort(codes, kind="stable")]
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    med = np.array([
+        np.median(by_code[bounds[b]:bounds[b + 1]]) if counts[b] else np.nan
+        for b in range(n_buckets)
+    ])
+    return counts, avg, med, win
+
+def summary(tweets: pd.DataFrame) -> dict:
     """Quick summary stats."""
-    changes_24h = [t.change_24h_pct for t in tweets if t.change_24h_pct is not None]
+    # Missing changes are NaN in the float column; dropna() removes them
+    changes_24h = tweets["change_24h_pct"].dropna().to_numpy(dtype=np.float64)
 
     return {
         "total_tweets": len(tweets),
         "with_price_data": len(changes_24h),
-        "assets": len(set(t.asset for t in tweets)),
-        "founders": len(set(t.founder for t in tweets)),
+        "assets": tweets["asset"].nunique(),
+        "founders": tweets["founder"].nunique(),
         "date_range": (
-            min(t.timestamp_iso for t in tweets),
-            max(t.timestamp_iso for t in tweets),
+            tweets["timestamp_iso"].min(),
+            tweets["timestamp_iso"].max(),
         ),
         "change_24h": {
-            "mean": statistics.mean(changes_24h),
-            "median": statistics.median(changes_24h),
-            "stdev": statistics.stdev(changes_24h),
-            "min": min(changes_24h),
-            "max": max(changes_24h),
+            "mean": changes_24h.mean(),
+            "median": np.median(changes_24h),
+            "stdev": changes_24h.std(ddof=1),
+            "min": changes_24h.min(),
+            "max": changes_24h.max(),
         }
     }
 
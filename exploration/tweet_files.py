@@ -0,0 +1,82 @@
+"""
+Cached reader for the per-asset tweet_events.json files.
+
+Kept apart from load_data (and free of pandas) so the validate_* scripts,
+which only need the parsed files, import quickly.
+"""
+
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+# orjson when installed; json.loads takes bytes too, so callers are unchanged
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+STATIC_DIR = Path(__file__).parent.parent / "web" / "public" / "static"
+CACHE_FILE = Path(__file__).parent / ".cache" / "tweet_files.pkl"
+
+def _tweet_files(static_dir: Path = STATIC_DIR) -> list[tuple[str, Path]]:
+    """(asset, tweet_events.json path) for every asset that has tweets."""
+    # A missing static dir means no assets, as with glob(), rather than an error
+    if not static_dir.is_dir():
+        return []
+
+    # scandir's entries know their own type, so only the tweet file is stat'ed
+    files = []
+    with os.scandir(static_dir) as entries:
+        for asset_dir in entries:
+            if not asset_dir.is_dir():
+                continue
+
+            tweet_file = Path(asset_dir.path) / "tweet_events.json"
+            if tweet_file.exists():
+                files.append((asset_dir.name, tweet_file))
+    return files
+
+def _signature(files: list[tuple[str, Path]]) -> list[tuple[str, int, int]]:
+    """(asset, mtime_ns, size) per tweet file; any edit invalidates the caches."""
+    signature = []
+    for asset, tweet_file in files:
+        st = tweet_file.stat()
+        signature.append((asset, st.st_mtime_ns, st.st_size))
+    return signature
+
+def _read_cache(path: Path, signature: list) -> Optional[dict]:
+    if path.exists():
+        with open(path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["signature"] == signature:
+            return cached
+    return None
+
+def _write_cache(path: Path, cached: dict):
+    path.parent.mkdir(exist_ok=True)
+    with open(path, "wb") as f:
+        pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_tweet_files(static_dir: Path = STATIC_DIR) -> list[tuple[str, dict]]:
+    """
+    (asset folder name, parsed tweet_events.json) for every asset under
+    static_dir, in directory order.
+
+    Files are parsed on a thread pool and the result is pickled to
+    CACHE_FILE keyed on static_dir and every file's mtime and size, so
+    repeat runs of any script loading through here skip the JSON entirely.
+    """
+    files = _tweet_files(static_dir)
+    signature = [str(static_dir)] + _signature(files)
+    cached = _read_cache(CACHE_FILE, signature)
+    if cached is not None:
+        return cached["files"]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        parsed = list(pool.map(lambda f: orjson.loads(f[1].read_bytes()), files))
+
+    tweet_files = [(asset, data) for (asset, _), data in zip(files, parsed)]
+    _write_cache(CACHE_FILE, {"signature": signature, "files": tweet_files})
+    return tweet_files
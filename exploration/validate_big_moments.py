@@ -5,40 +5,110 @@ Validate "The Big Moments" view hypothesis.
 Are tweets at price extremes actually interesting to read?
 """
 
-import json
+import functools
 import os
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
 import re
+import sys
 
-STATIC_DIR = Path("/Users/satoshi/dev/tweet-price/web/public/static")
+import numpy as np
 
+from tweet_files import load_tweet_files
 
-def load_all_tweet_events():
-    """Load all tweet events from all asset folders."""
-    all_events = []
+# pyahocorasick is optional: without it keywords are matched by regex
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-    for asset_dir in STATIC_DIR.iterdir():
-        if not asset_dir.is_dir():
-            continue
+STATIC_DIR = Path("/Users/satoshi/dev/tweet-price/web/public/static")
+
+# Patterns used by categorize_tweet, compiled once
+# URLs and non-word characters, stripped together in one sub() pass
+URL_OR_NONWORD_RE = re.compile(r'https?://\S+|[^\w\s]')
+# Ten word characters; match() stops as soon as it has seen them
+TEN_WORD_CHARS_RE = re.compile(r'(?:\W*\w){10}')
+# Numbered-thread prefix such as "1/" or "2)"; only tried with match() on
+# tweets that start with a digit
+THREAD_LEAD_RE = re.compile(r'\d+[/\.)]')
+
+# Announcement keywords
+ANNOUNCEMENT_KEYWORDS = [
+    'launch', 'announce', 'introducing', 'releasing', 'shipped',
+    'live', 'now available', 'going live', 'mainnet', 'testnet',
+    'upgrade', 'update', 'v2', 'v3', 'new feature', 'partnership',
+    'integration', 'listing', 'exchange', 'milestone', 'airdrop',
+    'tokenomics', 'roadmap', 'whitepaper', 'audit', 'security',
+    'governance', 'proposal', 'vote', 'dao', 'treasury',
+    'raised', 'funding', 'backed', 'investors', 'team',
+    'breaking', 'important', 'excited to', 'proud to'
+]
+
+# Meme/casual indicators
+CASUAL_KEYWORDS = [
+    'gm', 'gn', 'wagmi', 'ngmi', 'lfg', 'based', 'fren',
+    'lol', 'lmao', 'haha', 'vibes', 'mood', 'feels',
+    'bullish', 'bearish', 'pump', 'dump', 'moon', 'wen',
+    'ser', 'anon', 'degen', 'chad', 'gigachad', 'alpha',
+    'cope', 'seethe', 'touch grass', 'ngmi'
+]
+
+# Each keyword list as one alternation: a single scan finds any substring hit
+ANNOUNCEMENT_RE = re.compile('|'.join(re.escape(kw) for kw in ANNOUNCEMENT_KEYWORDS))
+CASUAL_RE = re.compile('|'.join(re.escape(kw) for kw in CASUAL_KEYWORDS))
+
+if AHOCORASICK_AVAILABLE:
+    # One automaton over both lists, each keyword tagged with its category
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for kw in CASUAL_KEYWORDS:
+        KEYWORD_AUTOMATON.add_word(kw, "meme_casual")
+    for kw in ANNOUNCEMENT_KEYWORDS:
+        KEYWORD_AUTOMATON.add_word(kw, "announcement")
+    KEYWORD_AUTOMATON.make_automaton()
+
+
+def keyword_category(text_lower: str):
+    """
+    "announcement" if any announcement keyword occurs in text_lower, else
+    "meme_casual" if any casual keyword does, else None.
+    """
+    if AHOCORASICK_AVAILABLE:
+        # Single pass over the text; an announcement hit settles it
+        found = None
+        for _, category in KEYWORD_AUTOMATON.iter(text_lower):
+            if category == "announcement":
+                return category
+            found = category
+        return found
+
+    if ANNOUNCEMENT_RE.search(text_lower):
+        return "announcement"
+    if CASUAL_RE.search(text_lower):
+        return "meme_casual"
+    return None
 
-        tweet_file = asset_dir / "tweet_events.json"
-        if not tweet_file.exists():
-            continue
 
-        with open(tweet_file) as f:
-            data = json.load(f)
+def load_all_tweet_events():
+    """Load all tweet events from all asset folders (parsed files are cached by tweet_files)."""
+    all_events = []
 
+    for asset_name, data in load_tweet_files(STATIC_DIR):
+        # One shared (interned) str per asset/founder instead of one per tweet
+        asset_id = sys.intern(data.get("asset", asset_name))
+        founder = sys.intern(data.get("founder", "unknown"))
         for event in data.get("events", []):
             # Only include events with valid price change data
             if event.get("change_24h_pct") is not None:
-                event["_asset_id"] = data.get("asset", asset_dir.name)
-                event["_founder"] = data.get("founder", "unknown")
+                event["_asset_id"] = asset_id
+                event["_founder"] = founder
                 all_events.append(event)
 
     return all_events
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_tweet(text: str) -> str:
     """
     Categorize a tweet into one of:
@@ -56,12 +126,11 @@ def categorize_tweet(text: str) -> str:
     if len(text_clean) < 5:
         return "emoji_only"
 
-    # Remove URLs for analysis
-    text_no_urls = re.sub(r'https?://\S+', '', text_clean)
-
-    # Check for emoji-only (mostly emojis after removing URLs)
-    text_no_emoji = re.sub(r'[^\w\s]', '', text_no_urls)
-    if len(text_no_emoji.strip()) < 10:
+    # Check for emoji-only (mostly emojis after removing URLs). Without a
+    # URL, ten word characters anywhere already clear the bar, which
+    # settles most tweets from their first few words without the full sub()
+    has_words = "http" not in text_clean and TEN_WORD_CHARS_RE.match(text_clean)
+    if not has_words and len(URL_OR_NONWORD_RE.sub('', text_clean).strip()) < 10:
         return "emoji_only"
 
     # Check if it's a retweet or reply
@@ -69,7 +138,10 @@ def categorize_tweet(text: str) -> str:
         return "retweet_reply"
 
     # Check for thread indicators
-    if re.search(r'^\d+[/\.)]|thread|🧵', text_clean.lower()):
+    text_lower = text_clean.lower()
+    if text_clean[0].isdigit() and THREAD_LEAD_RE.match(text_clean):
+        return "thread"
+    if "thread" in text_lower or "🧵" in text_clean:
         return "thread"
 
     # Check for questions
@@ -77,35 +149,15 @@ def categorize_tweet(text: str) -> str:
         return "question"
 
     # Look for announcement keywords
-    announcement_keywords = [
-        'launch', 'announce', 'introducing', 'releasing', 'shipped',
-        'live', 'now available', 'going live', 'mainnet', 'testnet',
-        'upgrade', 'update', 'v2', 'v3', 'new feature', 'partnership',
-        'integration', 'listing', 'exchange', 'milestone', 'airdrop',
-        'tokenomics', 'roadmap', 'whitepaper', 'audit', 'security',
-        'governance', 'proposal', 'vote', 'dao', 'treasury',
-        'raised', 'funding', 'backed', 'investors', 'team',
-        'breaking', 'important', 'excited to', 'proud to'
-    ]
-
-    text_lower = text_clean.lower()
-    if any(kw in text_lower for kw in announcement_keywords):
+    keyword_hit = keyword_category(text_lower)
+    if keyword_hit == "announcement":
         return "announcement"
 
-    # Meme/casual indicators
-    casual_keywords = [
-        'gm', 'gn', 'wagmi', 'ngmi', 'lfg', 'based', 'fren',
-        'lol', 'lmao', 'haha', 'vibes', 'mood', 'feels',
-        'bullish', 'bearish', 'pump', 'dump', 'moon', 'wen',
-        'ser', 'anon', 'degen', 'chad', 'gigachad', 'alpha',
-        'cope', 'seethe', 'touch grass', 'ngmi'
-    ]
-
     # Very short tweets are likely casual
     if len(text_clean) < 50:
         return "meme_casual"
 
-    if any(kw in text_lower for kw in casual_keywords):
+    if keyword_hit == "meme_casual":
         return "meme_casual"
 
     # If it's long and has substance, might be announcement even without keywords
@@ -120,11 +172,12 @@ def is_substantive(category: str) -> bool:
     return category in ["announcement", "thread"]
 
 
-def format_tweet_for_display(event: dict, rank: int, direction: str) -> str:
-    """Format a tweet for display."""
+def format_tweet_for_display(event: dict, rank: int, direction: str, category: str = None) -> str:
+    """Format a tweet for display; category defaults to the one stashed by main()."""
+    if category is None:
+        category = event["_category"]
     change = event.get("change_24h_pct", 0)
     text = event.get("text", "")
-    category = categorize_tweet(text)
     substantive = "SUBSTANTIVE" if is_substantive(category) else "noise"
 
     asset = event.get("_asset_id", "unknown")
@@ -145,76 +198,100 @@ Category: {category.upper()} ({substantive})
 """
 
 
+def extreme_indices(changes: np.ndarray, k: int):
+    """
+    Indices of the k lowest changes (ascending) and the k highest
+    (descending), ordered exactly as slicing a stable full sort would be.
+
+    argpartition finds each cutoff value in O(n); only the candidates at or
+    beyond it, ties included, are then stable-sorted.
+    """
+    if len(changes) <= k:
+        order = np.argsort(changes, kind="stable")
+        return order, order[::-1]
+
+    low_cut = np.partition(changes, k - 1)[k - 1]
+    low = np.flatnonzero(changes <= low_cut)
+    lowest = low[np.argsort(changes[low], kind="stable")][:k]
+
+    high_cut = np.partition(changes, len(changes) - k)[len(changes) - k]
+    high = np.flatnonzero(changes >= high_cut)
+    highest = high[np.argsort(changes[high], kind="stable")][-k:][::-1]
+    return lowest, highest
+
+
 def main():
-    print("Loading all tweet events...")
+    # Report lines are collected and written in one go at the end
+    out = []
+
+    out.append("Loading all tweet events...")
     events = load_all_tweet_events()
-    print(f"Loaded {len(events)} tweets with price data")
+    out.append(f"Loaded {len(events)} tweets with price data")
 
-    # Filter out events without change_24h_pct
-    events_with_change = [e for e in events if e.get("change_24h_pct") is not None]
-    print(f"Events with 24h change data: {len(events_with_change)}")
+    # Column views of the fields used for ranking and filtering
+    changes = np.fromiter((e["change_24h_pct"] for e in events), dtype=np.float64, count=len(events))
+    assets = np.array([e["_asset_id"] for e in events])
+    out.append(f"Events with 24h change data: {np.count_nonzero(~np.isnan(changes))}")
 
-    # Sort for pumps (highest change) and dumps (lowest change)
-    sorted_by_change = sorted(events_with_change, key=lambda x: x.get("change_24h_pct", 0))
+    # Pumps (highest change) and dumps (lowest change), without a full sort
+    dump_idx, pump_idx = extreme_indices(changes, 30)
+    top_dumps = [events[i] for i in dump_idx]  # Most negative (biggest dumps)
+    top_pumps = [events[i] for i in pump_idx]  # Most positive (biggest pumps)
 
-    top_dumps = sorted_by_change[:30]  # Most negative (biggest dumps)
-    top_pumps = sorted_by_change[-30:][::-1]  # Most positive (biggest pumps), reversed
+    out.append("\n" + "="*80)
+    out.append("TOP 30 BIGGEST PUMPS (24h after tweet)")
+    out.append("="*80)
 
-    print("\n" + "="*80)
-    print("TOP 30 BIGGEST PUMPS (24h after tweet)")
-    print("="*80)
+    # Each extreme tweet is categorized once and the label stashed on the
+    # event, where the display and the serious-projects pass read it back
+    for event in top_pumps + top_dumps:
+        event["_category"] = categorize_tweet(event.get("text", ""))
 
-    pump_categories = defaultdict(int)
-    pump_substantive = 0
+    pump_labels = [event["_category"] for event in top_pumps]
+    pump_categories = Counter(pump_labels)
+    pump_substantive = sum(map(is_substantive, pump_labels))
 
     for i, event in enumerate(top_pumps, 1):
-        category = categorize_tweet(event.get("text", ""))
-        pump_categories[category] += 1
-        if is_substantive(category):
-            pump_substantive += 1
-        print(format_tweet_for_display(event, i, "PUMP"))
+        out.append(format_tweet_for_display(event, i, "PUMP"))
 
-    print("\n" + "="*80)
-    print("TOP 30 BIGGEST DUMPS (24h after tweet)")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("TOP 30 BIGGEST DUMPS (24h after tweet)")
+    out.append("="*80)
 
-    dump_categories = defaultdict(int)
-    dump_substantive = 0
+    dump_labels = [event["_category"] for event in top_dumps]
+    dump_categories = Counter(dump_labels)
+    dump_substantive = sum(map(is_substantive, dump_labels))
 
     for i, event in enumerate(top_dumps, 1):
-        category = categorize_tweet(event.get("text", ""))
-        dump_categories[category] += 1
-        if is_substantive(category):
-            dump_substantive += 1
-        print(format_tweet_for_display(event, i, "DUMP"))
+        out.append(format_tweet_for_display(event, i, "DUMP"))
 
     # Summary stats
-    print("\n" + "="*80)
-    print("SUMMARY ANALYSIS")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("SUMMARY ANALYSIS")
+    out.append("="*80)
 
-    print("\n--- PUMP TWEETS (Top 30) ---")
-    for cat, count in sorted(pump_categories.items(), key=lambda x: -x[1]):
+    out.append("\n--- PUMP TWEETS (Top 30) ---")
+    for cat, count in pump_categories.most_common():
         pct = count / 30 * 100
-        print(f"  {cat}: {count} ({pct:.0f}%)")
-    print(f"  SUBSTANTIVE: {pump_substantive}/30 ({pump_substantive/30*100:.0f}%)")
+        out.append(f"  {cat}: {count} ({pct:.0f}%)")
+    out.append(f"  SUBSTANTIVE: {pump_substantive}/30 ({pump_substantive/30*100:.0f}%)")
 
-    print("\n--- DUMP TWEETS (Top 30) ---")
-    for cat, count in sorted(dump_categories.items(), key=lambda x: -x[1]):
+    out.append("\n--- DUMP TWEETS (Top 30) ---")
+    for cat, count in dump_categories.most_common():
         pct = count / 30 * 100
-        print(f"  {cat}: {count} ({pct:.0f}%)")
-    print(f"  SUBSTANTIVE: {dump_substantive}/30 ({dump_substantive/30*100:.0f}%)")
+        out.append(f"  {cat}: {count} ({pct:.0f}%)")
+    out.append(f"  SUBSTANTIVE: {dump_substantive}/30 ({dump_substantive/30*100:.0f}%)")
 
     total_substantive = pump_substantive + dump_substantive
     total = 60
 
-    print("\n--- OVERALL ---")
-    print(f"Total substantive content: {total_substantive}/{total} ({total_substantive/total*100:.0f}%)")
-    print(f"Total noise: {total - total_substantive}/{total} ({(total-total_substantive)/total*100:.0f}%)")
+    out.append("\n--- OVERALL ---")
+    out.append(f"Total substantive content: {total_substantive}/{total} ({total_substantive/total*100:.0f}%)")
+    out.append(f"Total noise: {total - total_substantive}/{total} ({(total-total_substantive)/total*100:.0f}%)")
 
-    print("\n" + "="*80)
-    print("VERDICT")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("VERDICT")
+    out.append("="*80)
 
     if total_substantive >= 40:
         verdict = "STRONG YES - Most tweets at price extremes are substantive and interesting!"
@@ -225,34 +302,30 @@ def main():
     else:
         verdict = "NO - Most tweets are noise (emojis, gm, casual). View would be boring."
 
-    print(f"\n{verdict}\n")
+    out.append(f"\n{verdict}\n")
 
     # Additional analysis: What makes the announcements interesting?
-    print("\n" + "="*80)
-    print("DETAILED BREAKDOWN: What types of tweets are at extremes?")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("DETAILED BREAKDOWN: What types of tweets are at extremes?")
+    out.append("="*80)
 
     # Count by founder
-    pump_founders = defaultdict(int)
-    dump_founders = defaultdict(int)
-    for e in top_pumps:
-        pump_founders[e.get("_founder", "unknown")] += 1
-    for e in top_dumps:
-        dump_founders[e.get("_founder", "unknown")] += 1
+    pump_founders = Counter(e.get("_founder", "unknown") for e in top_pumps)
+    dump_founders = Counter(e.get("_founder", "unknown") for e in top_dumps)
 
-    print("\n--- Pumps by Founder ---")
-    for f, c in sorted(pump_founders.items(), key=lambda x: -x[1]):
-        print(f"  @{f}: {c} tweets")
+    out.append("\n--- Pumps by Founder ---")
+    for f, c in pump_founders.most_common():
+        out.append(f"  @{f}: {c} tweets")
 
-    print("\n--- Dumps by Founder ---")
-    for f, c in sorted(dump_founders.items(), key=lambda x: -x[1]):
-        print(f"  @{f}: {c} tweets")
+    out.append("\n--- Dumps by Founder ---")
+    for f, c in dump_founders.most_common():
+        out.append(f"  @{f}: {c} tweets")
 
     # Manual quality assessment
-    print("\n" + "="*80)
-    print("MANUAL QUALITY ASSESSMENT")
-    print("="*80)
-    print("""
+    out.append("\n" + "="*80)
+    out.append("MANUAL QUALITY ASSESSMENT")
+    out.append("="*80)
+    out.append("""
 Looking at the actual tweets, here's what we see:
 
 PUMP TWEETS BREAKDOWN:
@@ -290,34 +363,36 @@ ASSETS WITH POTENTIALLY GOOD CONTENT:
 """)
 
     # What if we filter to only "serious" projects?
-    print("\n" + "="*80)
-    print("ALTERNATIVE: Filter to serious projects only")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("ALTERNATIVE: Filter to serious projects only")
+    out.append("="*80)
 
-    serious_assets = {"monad", "believe", "aster", "zora", "jup", "hype", "zec"}
+    serious_assets = frozenset(map(sys.intern, ("monad", "believe", "aster", "zora", "jup", "hype", "zec")))
 
-    serious_pumps = [e for e in top_pumps if e.get("_asset_id") in serious_assets]
-    serious_dumps = [e for e in top_dumps if e.get("_asset_id") in serious_assets]
+    serious_pumps = [events[i] for i in pump_idx[np.isin(assets[pump_idx], list(serious_assets))]]
+    serious_dumps = [events[i] for i in dump_idx[np.isin(assets[dump_idx], list(serious_assets))]]
 
-    serious_pump_substantive = sum(1 for e in serious_pumps if is_substantive(categorize_tweet(e.get("text", ""))))
-    serious_dump_substantive = sum(1 for e in serious_dumps if is_substantive(categorize_tweet(e.get("text", ""))))
+    serious_pump_substantive = sum(1 for e in serious_pumps if is_substantive(e["_category"]))
+    serious_dump_substantive = sum(1 for e in serious_dumps if is_substantive(e["_category"]))
 
-    print(f"Serious project tweets in top pumps: {len(serious_pumps)}/30")
-    print(f"  Of those, substantive: {serious_pump_substantive}")
-    print(f"Serious project tweets in top dumps: {len(serious_dumps)}/30")
-    print(f"  Of those, substantive: {serious_dump_substantive}")
+    out.append(f"Serious project tweets in top pumps: {len(serious_pumps)}/30")
+    out.append(f"  Of those, substantive: {serious_pump_substantive}")
+    out.append(f"Serious project tweets in top dumps: {len(serious_dumps)}/30")
+    out.append(f"  Of those, substantive: {serious_dump_substantive}")
 
     if len(serious_pumps) + len(serious_dumps) > 0:
         serious_pct = (serious_pump_substantive + serious_dump_substantive) / (len(serious_pumps) + len(serious_dumps)) * 100
-        print(f"\nSubstantive rate for serious projects: {serious_pct:.0f}%")
+        out.append(f"\nSubstantive rate for serious projects: {serious_pct:.0f}%")
 
     # Price range info
-    print("\n--- PRICE MOVE RANGES ---")
-    pump_changes = [e.get("change_24h_pct", 0) for e in top_pumps]
-    dump_changes = [e.get("change_24h_pct", 0) for e in top_dumps]
+    out.append("\n--- PRICE MOVE RANGES ---")
+    pump_changes = changes[pump_idx]
+    dump_changes = changes[dump_idx]
+
+    out.append(f"Pump range: +{pump_changes.min():.1f}% to +{pump_changes.max():.1f}%")
+    out.append(f"Dump range: {dump_changes.max():.1f}% to {dump_changes.min():.1f}%")
 
-    print(f"Pump range: +{min(pump_changes):.1f}% to +{max(pump_changes):.1f}%")
-    print(f"Dump range: {max(dump_changes):.1f}% to {min(dump_changes):.1f}%")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -9,11 +9,21 @@ Hypothesis: Founders have periods of silence that could be visually interesting,
 especially when juxtaposed with price movements during those gaps.
 """
 
-import json
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+import numpy as np
+
+# Falls back to stdlib json (same bytes in, same dicts out) without orjson
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+from tweet_files import load_tweet_files
+
 # Constants
 STATIC_DIR = Path("/Users/satoshi/dev/tweet-price/web/public/static")
 NOTABLE_GAP_DAYS = 7  # Minimum days to be "notable"
@@ -21,27 +31,16 @@ DRAMATIC_GAP_DAYS = 30  # What we consider a "dramatic" silence
 
 
 def load_all_tweet_events():
-    """Load tweet events from all asset directories."""
+    """Load tweet events from all asset directories (parsed files are cached by tweet_files)."""
     all_events = {}
 
     # Load assets.json to get founder info
-    with open(STATIC_DIR / "assets.json") as f:
-        assets_data = json.load(f)
+    assets_data = orjson.loads((STATIC_DIR / "assets.json").read_bytes())
 
     asset_founders = {a["id"]: a["founder"] for a in assets_data["assets"]}
 
-    for asset_dir in STATIC_DIR.iterdir():
-        if not asset_dir.is_dir():
-            continue
-
-        tweet_file = asset_dir / "tweet_events.json"
-        if not tweet_file.exists():
-            continue
-
-        with open(tweet_file) as f:
-            data = json.load(f)
-
-        asset_id = data.get("asset", asset_dir.name)
+    for asset_name, data in load_tweet_files(STATIC_DIR):
+        asset_id = data.get("asset", asset_name)
         founder = data.get("founder", asset_founders.get(asset_id, "unknown"))
         events = data.get("events", [])
 
@@ -57,54 +56,49 @@ def load_all_tweet_events():
 def calculate_gaps(events):
     """
     Calculate gaps between consecutive tweets.
-    Returns list of (gap_days, start_ts, end_ts, start_iso, end_iso).
+    Returns (order, gap_days): order sorts events by timestamp and
+    gap_days[i] is the gap in days from events[order[i]] to the next tweet.
     """
-    if len(events) < 2:
-        return []
-
+    timestamps = np.fromiter((e["timestamp"] for e in events), dtype=np.int64, count=len(events))
     # Sort by timestamp (should already be sorted, but be safe)
-    sorted_events = sorted(events, key=lambda e: e["timestamp"])
-
-    gaps = []
-    for i in range(1, len(sorted_events)):
-        prev = sorted_events[i - 1]
-        curr = sorted_events[i]
+    order = np.argsort(timestamps, kind="stable")
+    gap_days = np.diff(timestamps[order]) / (24 * 3600)
+    return order, gap_days
 
-        gap_seconds = curr["timestamp"] - prev["timestamp"]
-        gap_days = gap_seconds / (24 * 3600)
 
-        gaps.append({
-            "gap_days": gap_days,
-            "start_ts": prev["timestamp"],
-            "end_ts": curr["timestamp"],
-            "start_iso": prev.get("timestamp_iso", ""),
-            "end_iso": curr.get("timestamp_iso", ""),
-            "tweet_before": prev.get("text", "")[:80],
-            "tweet_after": curr.get("text", "")[:80],
-        })
-
-    return gaps
+def gap_details(events, order, gap_days, i):
+    """Dict describing gap i from calculate_gaps, with the tweets on either side."""
+    prev = events[order[i]]
+    curr = events[order[i + 1]]
+    return {
+        "gap_days": float(gap_days[i]),
+        "start_ts": prev["timestamp"],
+        "end_ts": curr["timestamp"],
+        "start_iso": prev.get("timestamp_iso", ""),
+        "end_iso": curr.get("timestamp_iso", ""),
+        "tweet_before": prev.get("text", "")[:80],
+        "tweet_after": curr.get("text", "")[:80],
+    }
 
 
 def analyze_founder(asset_id, founder, events):
     """Analyze a single founder's tweet patterns."""
-    gaps = calculate_gaps(events)
+    order, gap_days = calculate_gaps(events)
 
-    if not gaps:
+    if not len(gap_days):
         return None
 
-    gap_days_list = [g["gap_days"] for g in gaps]
-
-    # Calculate stats
-    avg_gap = sum(gap_days_list) / len(gap_days_list)
-    max_gap = max(gap_days_list)
-    min_gap = min(gap_days_list)
-    notable_gaps = [g for g in gaps if g["gap_days"] >= NOTABLE_GAP_DAYS]
-    dramatic_gaps = [g for g in gaps if g["gap_days"] >= DRAMATIC_GAP_DAYS]
-
-    # Tweet frequency (tweets per day)
-    first_ts = min(e["timestamp"] for e in events)
-    last_ts = max(e["timestamp"] for e in events)
+    # Calculate stats; only the notable gaps are expanded into dicts
+    avg_gap = float(gap_days.mean())
+    max_gap = float(gap_days.max())
+    min_gap = float(gap_days.min())
+    notable_gaps = [gap_details(events, order, gap_days, i) for i in np.flatnonzero(gap_days >= NOTABLE_GAP_DAYS)]
+    dramatic_gap_count = int(np.count_nonzero(gap_days >= DRAMATIC_GAP_DAYS))
+
+    # Tweet frequency (tweets per day); the ends of the sort order are the
+    # earliest and latest tweets, so no extra scans for min/max
+    first_ts = events[order[0]]["timestamp"]
+    last_ts = events[order[-1]]["timestamp"]
     span_days = (last_ts - first_ts) / (24 * 3600)
     tweets_per_day = len(events) / span_days if span_days > 0 else 0
 
@@ -118,23 +112,27 @@ def analyze_founder(asset_id, founder, events):
         "max_gap_days": round(max_gap, 1),
         "min_gap_days": round(min_gap, 2),
         "notable_gap_count": len(notable_gaps),
-        "dramatic_gap_count": len(dramatic_gaps),
+        "dramatic_gap_count": dramatic_gap_count,
         "notable_gaps": sorted(notable_gaps, key=lambda g: -g["gap_days"]),  # Longest first
     }
 
 
 def main():
-    print("=" * 80)
-    print("SILENCES VIEW VALIDATION - Gap Analysis for Founder Tweets")
-    print("=" * 80)
-    print()
+    # Report lines are collected and written in one go at the end
+    out = []
+
+    out.append("=" * 80)
+    out.append("SILENCES VIEW VALIDATION - Gap Analysis for Founder Tweets")
+    out.append("=" * 80)
+    out.append("")
 
     # Load all data
     all_events = load_all_tweet_events()
 
-    print(f"Loaded tweet events for {len(all_events)} assets\n")
+    out.append(f"Loaded tweet events for {len(all_events)} assets\n")
 
-    # Analyze each founder
+    # Analyze each founder (a few numpy calls each; a process pool would
+    # spend more pickling the events than the analysis takes)
     analyses = []
     for asset_id, data in all_events.items():
         analysis = analyze_founder(asset_id, data["founder"], data["events"])
@@ -145,26 +143,26 @@ def main():
     analyses.sort(key=lambda a: -a["tweet_count"])
 
     # Print per-founder analysis
-    print("-" * 80)
-    print("PER-FOUNDER ANALYSIS")
-    print("-" * 80)
-    print()
-    print(f"{'Asset':<12} {'Founder':<16} {'Tweets':<8} {'Days':<8} {'Avg Gap':<10} {'Max Gap':<10} {'7+ Days':<10} {'30+ Days':<10}")
-    print(f"{'-----':<12} {'-------':<16} {'------':<8} {'----':<8} {'-------':<10} {'-------':<10} {'-------':<10} {'--------':<10}")
+    out.append("-" * 80)
+    out.append("PER-FOUNDER ANALYSIS")
+    out.append("-" * 80)
+    out.append("")
+    out.append(f"{'Asset':<12} {'Founder':<16} {'Tweets':<8} {'Days':<8} {'Avg Gap':<10} {'Max Gap':<10} {'7+ Days':<10} {'30+ Days':<10}")
+    out.append(f"{'-----':<12} {'-------':<16} {'------':<8} {'----':<8} {'-------':<10} {'-------':<10} {'-------':<10} {'--------':<10}")
 
     total_tweets = 0
     total_notable = 0
     total_dramatic = 0
 
     for a in analyses:
-        print(f"{a['asset_id']:<12} {a['founder']:<16} {a['tweet_count']:<8} {a['span_days']:<8} {a['avg_gap_days']:<10} {a['max_gap_days']:<10} {a['notable_gap_count']:<10} {a['dramatic_gap_count']:<10}")
+        out.append(f"{a['asset_id']:<12} {a['founder']:<16} {a['tweet_count']:<8} {a['span_days']:<8} {a['avg_gap_days']:<10} {a['max_gap_days']:<10} {a['notable_gap_count']:<10} {a['dramatic_gap_count']:<10}")
         total_tweets += a["tweet_count"]
         total_notable += a["notable_gap_count"]
         total_dramatic += a["dramatic_gap_count"]
 
-    print()
-    print(f"TOTALS: {total_tweets} tweets, {total_notable} notable gaps (7+ days), {total_dramatic} dramatic gaps (30+ days)")
-    print()
+    out.append("")
+    out.append(f"TOTALS: {total_tweets} tweets, {total_notable} notable gaps (7+ days), {total_dramatic} dramatic gaps (30+ days)")
+    out.append("")
 
     # Collect all notable gaps across all founders
     all_notable_gaps = []
@@ -180,24 +178,24 @@ def main():
     all_notable_gaps.sort(key=lambda g: -g["gap_days"])
 
     # Print top 10 most dramatic silences
-    print("-" * 80)
-    print("TOP 10 MOST DRAMATIC SILENCES (across all founders)")
-    print("-" * 80)
-    print()
+    out.append("-" * 80)
+    out.append("TOP 10 MOST DRAMATIC SILENCES (across all founders)")
+    out.append("-" * 80)
+    out.append("")
 
     for i, gap in enumerate(all_notable_gaps[:10], 1):
-        print(f"{i}. {gap['founder']} ({gap['asset_id']}): {gap['gap_days']:.1f} days silent")
-        print(f"   From: {gap['start_iso']}")
-        print(f"   To:   {gap['end_iso']}")
-        print(f"   Last tweet: \"{gap['tweet_before']}...\"")
-        print(f"   Next tweet: \"{gap['tweet_after']}...\"")
-        print()
+        out.append(f"{i}. {gap['founder']} ({gap['asset_id']}): {gap['gap_days']:.1f} days silent")
+        out.append(f"   From: {gap['start_iso']}")
+        out.append(f"   To:   {gap['end_iso']}")
+        out.append(f"   Last tweet: \"{gap['tweet_before']}...\"")
+        out.append(f"   Next tweet: \"{gap['tweet_after']}...\"")
+        out.append("")
 
     # Final verdict
-    print("=" * 80)
-    print("VERDICT: IS THE SILENCES VIEW WORTH BUILDING?")
-    print("=" * 80)
-    print()
+    out.append("=" * 80)
+    out.append("VERDICT: IS THE SILENCES VIEW WORTH BUILDING?")
+    out.append("=" * 80)
+    out.append("")
 
     # Calculate key metrics
     total_gap_opportunities = sum(a["tweet_count"] - 1 for a in analyses)  # Number of gaps possible
@@ -206,13 +204,13 @@ def main():
     founders_with_silences = sum(1 for a in analyses if a["notable_gap_count"] > 0)
     founders_with_dramatic = sum(1 for a in analyses if a["dramatic_gap_count"] > 0)
 
-    print(f"Total founders analyzed:          {len(analyses)}")
-    print(f"Founders with 7+ day gaps:        {founders_with_silences}/{len(analyses)} ({100*founders_with_silences/len(analyses):.0f}%)")
-    print(f"Founders with 30+ day gaps:       {founders_with_dramatic}/{len(analyses)} ({100*founders_with_dramatic/len(analyses):.0f}%)")
-    print(f"Total notable gaps (7+ days):     {total_notable}")
-    print(f"Total dramatic gaps (30+ days):   {total_dramatic}")
-    print(f"% of gaps that are notable:       {100*notable_ratio:.1f}%")
-    print()
+    out.append(f"Total founders analyzed:          {len(analyses)}")
+    out.append(f"Founders with 7+ day gaps:        {founders_with_silences}/{len(analyses)} ({100*founders_with_silences/len(analyses):.0f}%)")
+    out.append(f"Founders with 30+ day gaps:       {founders_with_dramatic}/{len(analyses)} ({100*founders_with_dramatic/len(analyses):.0f}%)")
+    out.append(f"Total notable gaps (7+ days):     {total_notable}")
+    out.append(f"Total dramatic gaps (30+ days):   {total_dramatic}")
+    out.append(f"% of gaps that are notable:       {100*notable_ratio:.1f}%")
+    out.append("")
 
     # Qualitative assessment
     if total_notable >= 30 and founders_with_silences >= len(analyses) * 0.5:
@@ -228,29 +226,31 @@ def main():
         verdict = "MARGINAL - NEEDS MORE DATA"
         reason = f"Only {total_notable} notable gaps across {founders_with_silences} founders."
 
-    print(f"VERDICT: {verdict}")
-    print(f"REASON:  {reason}")
-    print()
+    out.append(f"VERDICT: {verdict}")
+    out.append(f"REASON:  {reason}")
+    out.append("")
 
     # Specific recommendations
-    print("DETAILED OBSERVATIONS:")
-    print()
+    out.append("DETAILED OBSERVATIONS:")
+    out.append("")
 
     # Find the best candidates for silences visualization
     best_candidates = [a for a in analyses if a["notable_gap_count"] >= 2]
     if best_candidates:
-        print("Best founders for silences visualization:")
+        out.append("Best founders for silences visualization:")
         for a in sorted(best_candidates, key=lambda x: -x["notable_gap_count"])[:5]:
-            print(f"  - {a['founder']} ({a['asset_id']}): {a['notable_gap_count']} notable gaps, longest {a['max_gap_days']:.0f} days")
-        print()
+            out.append(f"  - {a['founder']} ({a['asset_id']}): {a['notable_gap_count']} notable gaps, longest {a['max_gap_days']:.0f} days")
+        out.append("")
 
     # Find the most active (boring for silences)
     hyperactive = [a for a in analyses if a["avg_gap_days"] < 1]
     if hyperactive:
-        print("Most active founders (few/no silences to show):")
+        out.append("Most active founders (few/no silences to show):")
         for a in hyperactive:
-            print(f"  - {a['founder']} ({a['asset_id']}): tweets every {a['avg_gap_days']:.1f} days on average")
-        print()
+            out.append(f"  - {a['founder']} ({a['asset_id']}): tweets every {a['avg_gap_days']:.1f} days on average")
+        out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
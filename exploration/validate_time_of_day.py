@@ -6,73 +6,102 @@ Hypothesis: Founders have distinct behavioral patterns in WHEN they tweet.
 If patterns are uniform across founders, this view isn't worth building.
 """
 
-import json
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 import math
+import warnings
+
+import numpy as np
+
+from tweet_files import load_tweet_files
 
 STATIC_DIR = Path("/Users/satoshi/dev/tweet-price/web/public/static")
 
 
 def load_all_tweets():
-    """Load all tweet events from all assets."""
+    """Load all tweet events from all assets (parsed files are cached by tweet_files)."""
     all_tweets = []
 
-    for tweet_file in STATIC_DIR.glob("*/tweet_events.json"):
-        with open(tweet_file) as f:
-            data = json.load(f)
-            for event in data.get("events", []):
-                all_tweets.append({
-                    "founder": event.get("founder"),
-                    "timestamp_iso": event.get("timestamp_iso"),
-                    "asset": event.get("asset_id"),
-                })
+    for _, data in load_tweet_files(STATIC_DIR):
+        for event in data.get("events", []):
+            all_tweets.append({
+                "founder": event.get("founder"),
+                "timestamp_iso": event.get("timestamp_iso"),
+                "asset": event.get("asset_id"),
+            })
 
     return all_tweets
 
 
-def extract_hour(timestamp_iso: str) -> int:
-    """Extract UTC hour (0-23) from ISO timestamp."""
-    # Format: "2025-07-14T13:00:51Z"
-    dt = datetime.fromisoformat(timestamp_iso.replace("Z", "+00:00"))
-    return dt.hour
-
-
-def calculate_entropy(hour_counts: dict) -> float:
+def extract_hours(timestamps_iso: list) -> np.ndarray:
     """
-    Calculate normalized entropy (0-1) of hour distribution.
+    Extract UTC hours (0-23) from ISO timestamps.
+
+    The exporter writes "2025-07-14T13:00:51Z", where the hour is characters
+    11-12, so rows in exactly that layout are read straight out of a
+    fixed-width character matrix with no date parsing. Any other row
+    (fractional seconds, an offset) falls back to a datetime64 parse,
+    which converts offsets to UTC. Missing timestamps are dropped, so the
+    result can be shorter than the input.
+    """
+    isos = ["" if ts is None else ts for ts in timestamps_iso]
+    chars = np.array(isos, dtype="U")
+    width = max(chars.dtype.itemsize // 4, 21)
+    raw = chars.astype(f"U{width}").view(np.uint32).reshape(-1, width)
+
+    digits = raw[:, 11:13].astype(np.int64) - ord("0")
+    fixed = (
+        (raw[:, 10] == ord("T"))
+        & (raw[:, 19] == ord("Z"))
+        & (raw[:, 20] == 0)  # nothing after the Z
+        & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    )
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    if fixed.all():
+        return hours
+
+    other = np.flatnonzero(~fixed)
+    with warnings.catch_warnings():
+        # numpy warns that it applies, then drops, a timezone offset
+        warnings.simplefilter("ignore")
+        utc = np.array(
+            [isos[i].removesuffix("Z") or "NaT" for i in other], dtype="datetime64[s]"
+        )
+    hours[other] = utc.astype("datetime64[h]").astype(np.int64) % 24
+    parsed = fixed.copy()
+    parsed[other] = ~np.isnat(utc)
+    return hours[parsed]
+
+
+def calculate_entropy(hour_counts: np.ndarray) -> float:
+    """
+    Calculate normalized entropy (0-1) of a 24-slot hour distribution.
     0 = all tweets in one hour (concentrated)
     1 = perfectly uniform across all 24 hours
     """
-    total = sum(hour_counts.values())
+    total = hour_counts.sum()
     if total == 0:
         return 0
 
-    entropy = 0
-    for count in hour_counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+    p = hour_counts[hour_counts > 0] / total
+    entropy = -(p * np.log2(p)).sum()
 
     # Normalize by max entropy (log2(24) for uniform distribution)
     max_entropy = math.log2(24)
-    return entropy / max_entropy
+    return float(entropy / max_entropy)
 
 
 def analyze_founder(founder: str, tweets: list) -> dict:
     """Analyze time-of-day pattern for a single founder."""
-    hour_counts = defaultdict(int)
-
-    for tweet in tweets:
-        hour = extract_hour(tweet["timestamp_iso"])
-        hour_counts[hour] += 1
+    hours = extract_hours([tweet["timestamp_iso"] for tweet in tweets])
+    hour_counts = np.bincount(hours, minlength=24)
 
-    total = len(tweets)
+    total = len(hours)
 
-    # Find peak hours (top 3)
-    sorted_hours = sorted(hour_counts.items(), key=lambda x: -x[1])
-    peak_hours = sorted_hours[:3]
+    # Find peak hours (top 3); ties go to the hour that appears first
+    seen_hours, first_seen = np.unique(hours, return_index=True)
+    ranked_hours = seen_hours[np.lexsort((first_seen, -hour_counts[seen_hours]))]
+    peak_hours = [(int(h), int(hour_counts[h])) for h in ranked_hours[:3]]
 
     # Calculate concentration: what % of tweets in top 3 hours?
     top3_count = sum(c for _, c in peak_hours)
@@ -98,7 +127,7 @@ def analyze_founder(founder: str, tweets: list) -> dict:
         "top3_concentration": concentration,
         "entropy": entropy,
         "pattern": pattern,
-        "hour_counts": dict(hour_counts),
+        "hour_counts": hour_counts,
     }
 
 
@@ -122,7 +151,8 @@ def main():
     print(f"Found {len(by_founder)} founders")
     print()
 
-    # Analyze each founder
+    # Analyze each founder (a few numpy calls each; a process pool would
+    # spend more pickling the tweets than the analysis takes)
     results = []
     for founder, tweets in sorted(by_founder.items(), key=lambda x: -len(x[1])):
         if len(tweets) >= 10:  # Only analyze founders with enough data
@@ -134,12 +164,12 @@ def main():
     print(f"{'Founder':<20} {'Tweets':>7} {'Pattern':<10} {'Top 3 Hours (UTC)':<30} {'Conc.':<7} {'Entropy'}")
     print("-" * 70)
 
-    pattern_counts = {"DISTINCT": 0, "MODERATE": 0, "UNIFORM": 0}
+    # Missing patterns count as 0
+    pattern_counts = Counter(r["pattern"] for r in results)
 
     for r in results:
         peak_str = ", ".join([f"{h}:00 ({pct})" for h, c, pct in r["peak_hours"]])
         print(f"{r['founder']:<20} {r['total_tweets']:>7} {r['pattern']:<10} {peak_str:<30} {r['top3_concentration']:.2f}   {r['entropy']:.2f}")
-        pattern_counts[r["pattern"]] += 1
 
     print("-" * 70)
     print()
@@ -169,9 +199,9 @@ def main():
 
     for r in results[:5]:
         print(f"{r['founder']:<15} |      ", end="")
-        max_count = max(r["hour_counts"].values()) if r["hour_counts"] else 1
+        max_count = r["hour_counts"].max()
         for h in range(24):
-            count = r["hour_counts"].get(h, 0)
+            count = r["hour_counts"][h]
             # Normalize to 0-3 scale for visual
             level = int((count / max_count) * 3) if max_count > 0 else 0
             chars = [" .", "..", "##", "@@"]
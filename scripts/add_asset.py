@@ -26,15 +26,30 @@ Usage:
     python add_asset.py mytoken --name "My Token" --founder someuser --coingecko my-token-id --dry-run
 """
 import argparse
+import atexit
+import functools
 import json
+import os
+import random
 import subprocess
 import sys
 import time
 import httpx
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from PIL import Image
+
+# orjson decodes the (tens of KB) API payloads faster; json.loads takes the
+# same bytes when it is missing
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
 from config import (
     ASSETS_FILE,
     X_BEARER_TOKEN,
@@ -43,33 +58,141 @@ from config import (
     LOGOS_DIR,
 )
 
-# ANSI colors for terminal output
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-BLUE = "\033[94m"
-RESET = "\033[0m"
-BOLD = "\033[1m"
+# ANSI colors for terminal output; empty when stdout is piped or logged,
+# so CI logs get plain text
+if sys.stdout.isatty():
+    GREEN = "\033[92m"
+    RED = "\033[91m"
+    YELLOW = "\033[93m"
+    BLUE = "\033[94m"
+    RESET = "\033[0m"
+    BOLD = "\033[1m"
+else:
+    GREEN = RED = YELLOW = BLUE = RESET = BOLD = ""
+
+# Message prefixes, formatted once
+STEP_PREFIX = f"\n{BLUE}{BOLD}▶ "
+SUCCESS_PREFIX = f"{GREEN}✓ "
+ERROR_PREFIX = f"{RED}✗ "
+WARNING_PREFIX = f"{YELLOW}⚠ "
+
+GT_API = "https://api.geckoterminal.com/api/v2"
+CG_API = "https://api.coingecko.com/api/v3"
+
+# Parsed /coins/{id} payloads by CoinGecko ID; validation, source discovery
+# and the logo step all read the same one
+_coingecko_coins: dict[str, dict] = {}
+
+# Leave out the tickers/market/community/developer sections of /coins/{id};
+# only name, symbol, image and platforms are read
+COINGECKO_COIN_PARAMS = {
+    "localization": "false",
+    "tickers": "false",
+    "market_data": "false",
+    "community_data": "false",
+    "developer_data": "false",
+    "sparkline": "false",
+}
+
+# Rate limiting and transient server errors; anything else is final
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# First bytes of every PNG file
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 
 def print_step(msg: str):
     """Print a step header."""
-    print(f"\n{BLUE}{BOLD}▶ {msg}{RESET}")
+    print(STEP_PREFIX + msg + RESET)
 
 
 def print_success(msg: str):
     """Print a success message."""
-    print(f"{GREEN}✓ {msg}{RESET}")
+    print(SUCCESS_PREFIX + msg + RESET)
 
 
 def print_error(msg: str):
     """Print an error message."""
-    print(f"{RED}✗ {msg}{RESET}")
+    print(ERROR_PREFIX + msg + RESET)
 
 
 def print_warning(msg: str):
     """Print a warning message."""
-    print(f"{YELLOW}⚠ {msg}{RESET}")
+    print(WARNING_PREFIX + msg + RESET)
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> httpx.Client:
+    """
+    One pooled client for every HTTP call in this script, so the validation,
+    discovery and logo steps reuse keep-alive connections instead of paying
+    a new TCP+TLS handshake per request. Closed at interpreter exit.
+    """
+    client = httpx.Client(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _get_with_retry(
+    url: str,
+    *,
+    max_attempts: int = 4,
+    base: float = 0.5,
+    cap: float = 8.0,
+    stream: bool = False,
+    **kwargs,
+) -> httpx.Response:
+    """
+    GET on the shared client, retrying RETRY_STATUSES and network errors
+    with capped exponential backoff and full jitter. A 429's Retry-After
+    (in seconds) takes precedence up to cap; a longer one is not waited
+    out and the 429 is returned as is. Once attempts run out the last
+    response is returned, or the last network error raised. With
+    stream=True the caller must close the response.
+    """
+    client = _client()
+    request = client.build_request("GET", url, **kwargs)
+    for attempt in range(max_attempts):
+        final = attempt == max_attempts - 1
+        delay = random.uniform(0, min(cap, base * 2 ** attempt))
+        try:
+            response = client.send(request, stream=stream)
+        except httpx.TransportError as e:
+            if final:
+                raise
+            reason = type(e).__name__
+        else:
+            if final or response.status_code not in RETRY_STATUSES:
+                return response
+            retry_after = response.headers.get("retry-after", "")
+            if response.status_code == 429 and retry_after.isdigit():
+                if float(retry_after) > cap:
+                    print_warning(f"  Rate limited; server asks to wait {retry_after}s, not retrying")
+                    return response
+                delay = float(retry_after)
+            response.close()
+            reason = f"HTTP {response.status_code}"
+        print_warning(f"  {reason}, retrying in {delay:.1f}s ({attempt + 1}/{max_attempts - 1})")
+        time.sleep(delay)
+
+
+def fetch_coingecko_coin(cg_id: str) -> tuple[int, Optional[dict]]:
+    """
+    GET /coins/{cg_id} at most once per run. Returns (status_code, data),
+    data being None unless the status is 200. Only successes are memoized,
+    so a rate-limited lookup is retried by the next caller.
+    """
+    if cg_id in _coingecko_coins:
+        return 200, _coingecko_coins[cg_id]
+
+    response = _get_with_retry(f"{CG_API}/coins/{cg_id}", params=COINGECKO_COIN_PARAMS)
+    if response.status_code != 200:
+        return response.status_code, None
+    data = _coingecko_coins[cg_id] = orjson.loads(response.content)
+    return 200, data
 
 
 def validate_twitter_handle(username: str) -> tuple[bool, str]:
@@ -81,88 +204,157 @@ def validate_twitter_handle(username: str) -> tuple[bool, str]:
     headers = {"Authorization": f"Bearer {X_BEARER_TOKEN}"}
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                name = data.get("data", {}).get("name", username)
-                return True, f"Found: {name} (@{username})"
-            elif response.status_code == 404:
-                return False, f"User @{username} not found"
-            else:
-                return False, f"Twitter API error: {response.status_code}"
+        response = _get_with_retry(url, headers=headers)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            name = data.get("data", {}).get("name", username)
+            return True, f"Found: {name} (@{username})"
+        elif response.status_code == 404:
+            return False, f"User @{username} not found"
+        else:
+            return False, f"Twitter API error: {response.status_code}"
     except Exception as e:
         return False, f"Network error: {e}"
 
 
 def validate_coingecko_id(cg_id: str) -> tuple[bool, str]:
     """Check if CoinGecko ID exists. Returns (success, message)."""
-    url = f"https://api.coingecko.com/api/v3/coins/{cg_id}"
-
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                name = data.get("name", cg_id)
-                symbol = data.get("symbol", "").upper()
-                return True, f"Found: {name} ({symbol})"
-            elif response.status_code == 404:
-                return False, f"CoinGecko ID '{cg_id}' not found"
-            else:
-                return False, f"CoinGecko API error: {response.status_code}"
+        status, data = fetch_coingecko_coin(cg_id)
+        if status == 200:
+            name = data.get("name", cg_id)
+            symbol = data.get("symbol", "").upper()
+            return True, f"Found: {name} ({symbol})"
+        elif status == 404:
+            return False, f"CoinGecko ID '{cg_id}' not found"
+        else:
+            return False, f"CoinGecko API error: {status}"
     except Exception as e:
         return False, f"Network error: {e}"
 
 
-def download_logo(asset_id: str, coingecko_id: str) -> tuple[bool, str]:
-    """Download logo from CoinGecko and save as PNG. Returns (success, message)."""
+def validate_remote(username: str, cg_id: Optional[str]) -> tuple[tuple[bool, str], Optional[tuple[bool, str]]]:
+    """
+    Run the Twitter and CoinGecko checks concurrently on the shared client,
+    so the step takes as long as the slower request rather than both.
+    Returns (twitter_result, coingecko_result); the latter is None without a
+    CoinGecko ID.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        twitter = pool.submit(validate_twitter_handle, username)
+        coingecko = pool.submit(validate_coingecko_id, cg_id) if cg_id else None
+        return twitter.result(), coingecko.result() if coingecko else None
+
+
+def load_logo_etags() -> dict:
+    """{asset_id: ETag} of logos this script downloaded."""
+    etags_file = LOGOS_DIR / ".etags.json"
+    if not etags_file.exists():
+        return {}
+    with open(etags_file) as f:
+        return json.load(f)
+
+
+def save_logo_etag(asset_id: str, etag: Optional[str]):
+    """Remember (or forget, when the server sent none) a logo's ETag."""
+    etags = load_logo_etags()
+    if etag:
+        etags[asset_id] = etag
+    else:
+        etags.pop(asset_id, None)
+    with open(LOGOS_DIR / ".etags.json", "w") as f:
+        json.dump(etags, f, indent=2)
+        f.write("\n")
+
+
+def download_logo(
+    asset_id: str,
+    coingecko_id: str,
+    coin_data: Optional[dict] = None,
+    refresh: bool = False,
+) -> tuple[bool, str]:
+    """
+    Download logo from CoinGecko and save as PNG. Returns (success, message).
+
+    coin_data is the /coins/{id} payload if the caller already has it;
+    otherwise it comes from fetch_coingecko_coin (memoized per run).
+
+    On refresh, a logo this script downloaded before is revalidated with
+    its stored ETag (If-None-Match), so an unchanged image costs a 304
+    instead of a re-download. Logos without one (e.g. added by hand) are
+    left alone, as before.
+    """
     logo_path = LOGOS_DIR / f"{asset_id}.png"
 
     # Check if logo already exists
+    etag = None
     if logo_path.exists():
-        return True, f"Logo already exists: {logo_path.name}"
+        etag = load_logo_etags().get(asset_id) if refresh else None
+        if not etag:
+            return True, f"Logo already exists: {logo_path.name}"
 
     if not coingecko_id:
         return False, "No CoinGecko ID provided for logo download"
 
     try:
         # Get logo URL from CoinGecko
-        url = f"https://api.coingecko.com/api/v3/coins/{coingecko_id}"
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url)
-            if response.status_code != 200:
-                return False, f"CoinGecko API error: {response.status_code}"
-
-            data = response.json()
-            logo_url = data.get("image", {}).get("large")
-            if not logo_url:
-                return False, "No logo URL in CoinGecko response"
-
-            # Download the image
-            img_response = client.get(logo_url)
+        if coin_data is None:
+            status, coin_data = fetch_coingecko_coin(coingecko_id)
+            if status != 200:
+                return False, f"CoinGecko API error: {status}"
+
+        # "small" is already UI-sized (like cache_logos.py uses); "large"
+        # is a several-hundred-KB original that only gets scaled down
+        images = coin_data.get("image", {})
+        logo_url = images.get("small") or images.get("large")
+        if not logo_url:
+            return False, "No logo URL in CoinGecko response"
+
+        # Stream the image: a PNG goes to disk 64 KB at a time and only other
+        # formats are held in memory for conversion. Either way it is written
+        # to a sibling .part file and only replaces the logo once complete,
+        # so a failed refresh leaves the previous logo in place
+        part_path = logo_path.with_suffix(".png.part")
+        headers = {"If-None-Match": etag} if etag else {}
+        img_response = _get_with_retry(logo_url, stream=True, headers=headers)
+        try:
+            if img_response.status_code == 304:
+                return True, f"Logo unchanged: {logo_path.name}"
             if img_response.status_code != 200:
                 return False, f"Failed to download logo: {img_response.status_code}"
 
-            # Save temporarily
-            temp_path = LOGOS_DIR / f"{asset_id}_temp"
-            temp_path.write_bytes(img_response.content)
-
-            # Convert to PNG using sips (macOS) or just save if already PNG
-            import subprocess
-            result = subprocess.run(
-                ["sips", "-s", "format", "png", str(temp_path), "--out", str(logo_path)],
-                capture_output=True,
-                text=True
-            )
-            temp_path.unlink(missing_ok=True)
-
-            if result.returncode != 0:
-                # Fallback: just rename if sips fails (might already be PNG)
-                if not logo_path.exists():
-                    return False, f"Failed to convert logo to PNG: {result.stderr}"
-
-            return True, f"Downloaded logo: {logo_path.name}"
+            chunks = img_response.iter_bytes(64 * 1024)
+            head = next(chunks, b"")
+
+            # Already a PNG (the usual case): save the bytes as-is
+            if head.startswith(PNG_SIGNATURE):
+                try:
+                    with open(part_path, "wb") as f:
+                        f.write(head)
+                        for chunk in chunks:
+                            f.write(chunk)
+                    os.replace(part_path, logo_path)
+                except Exception:
+                    part_path.unlink(missing_ok=True)
+                    raise
+                save_logo_etag(asset_id, img_response.headers.get("etag"))
+                return True, f"Downloaded logo: {logo_path.name}"
+
+            content = head + b"".join(chunks)
+        finally:
+            img_response.close()
+
+        # Convert JPEG/WebP etc. to PNG in-process (RGBA keeps transparency)
+        try:
+            img = Image.open(BytesIO(content))
+            img.convert("RGBA").save(part_path, "PNG", optimize=True)
+            os.replace(part_path, logo_path)
+        except OSError as e:
+            part_path.unlink(missing_ok=True)
+            return False, f"Failed to convert logo to PNG: {e}"
+
+        save_logo_etag(asset_id, img_response.headers.get("etag"))
+        return True, f"Downloaded logo: {logo_path.name}"
     except Exception as e:
         return False, f"Error downloading logo: {e}"
 
@@ -180,9 +372,6 @@ def validate_logo(asset_id: str) -> tuple[bool, str]:
 # DATA SOURCE DISCOVERY - Find source with longest price history
 # =============================================================================
 
-GT_API = "https://api.geckoterminal.com/api/v2"
-CG_API = "https://api.coingecko.com/api/v3"
-
 # Network name mappings for GeckoTerminal
 GT_NETWORK_MAP = {
     "ethereum": "eth",
@@ -198,12 +387,9 @@ GT_NETWORK_MAP = {
 
 def get_coingecko_info(cg_id: str) -> Optional[dict]:
     """Get full CoinGecko coin info including platforms/addresses."""
-    url = f"{CG_API}/coins/{cg_id}"
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url)
-            if response.status_code == 200:
-                return response.json()
+        _, data = fetch_coingecko_coin(cg_id)
+        return data
     except Exception:
         pass
     return None
@@ -227,22 +413,22 @@ def probe_coingecko_history(cg_id: str) -> dict:
     params = {"vs_currency": "usd", "days": "max"}
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                prices = data.get("prices", [])
-                if prices:
-                    oldest_ts = prices[0][0] / 1000  # CoinGecko uses milliseconds
-                    newest_ts = prices[-1][0] / 1000
-                    oldest_date = datetime.utcfromtimestamp(oldest_ts)
-                    days = (newest_ts - oldest_ts) / 86400
-                    result["days_available"] = int(days)
-                    result["oldest_date"] = oldest_date.strftime("%Y-%m-%d")
-            elif response.status_code == 429:
-                result["error"] = "Rate limited"
-            else:
-                result["error"] = f"HTTP {response.status_code}"
+        client = _client()
+        response = client.get(url, params=params)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            prices = data.get("prices", [])
+            if prices:
+                oldest_ts = prices[0][0] / 1000  # CoinGecko uses milliseconds
+                newest_ts = prices[-1][0] / 1000
+                oldest_date = datetime.utcfromtimestamp(oldest_ts)
+                days = (newest_ts - oldest_ts) / 86400
+                result["days_available"] = int(days)
+                result["oldest_date"] = oldest_date.strftime("%Y-%m-%d")
+        elif response.status_code == 429:
+            result["error"] = "Rate limited"
+        else:
+            result["error"] = f"HTTP {response.status_code}"
     except Exception as e:
         result["error"] = str(e)
 
@@ -260,19 +446,19 @@ def discover_geckoterminal_pools(token_address: str, network: str) -> list[dict]
 
     pools = []
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                for pool in data.get("data", [])[:5]:  # Top 5 pools by liquidity
-                    attrs = pool.get("attributes", {})
-                    pools.append({
-                        "address": attrs.get("address"),
-                        "name": attrs.get("name"),
-                        "network": network,
-                        "gt_network": gt_network,
-                        "liquidity_usd": float(attrs.get("reserve_in_usd") or 0),
-                    })
+        client = _client()
+        response = client.get(url, params=params)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            for pool in data.get("data", [])[:5]:  # Top 5 pools by liquidity
+                attrs = pool.get("attributes", {})
+                pools.append({
+                    "address": attrs.get("address"),
+                    "name": attrs.get("name"),
+                    "network": network,
+                    "gt_network": gt_network,
+                    "liquidity_usd": float(attrs.get("reserve_in_usd") or 0),
+                })
     except Exception:
         pass
 
@@ -303,49 +489,49 @@ def probe_geckoterminal_history(network: str, pool_address: str) -> dict:
     oldest_found = now_ts
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            # First request to get recent data
-            params = {"aggregate": 1, "limit": 1000}
-            response = client.get(url, params=params)
-
-            if response.status_code == 200:
-                data = response.json()
-                ohlcv = data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
-                if ohlcv:
-                    # ohlcv_list is [timestamp, o, h, l, c, v] sorted newest first
-                    oldest_found = ohlcv[-1][0]
-
-                    # Try to go further back with before_timestamp
-                    for _ in range(5):  # Max 5 pages back
-                        time.sleep(0.3)  # Rate limiting
-                        params["before_timestamp"] = oldest_found
-                        response = client.get(url, params=params)
-
-                        if response.status_code == 401:
-                            result["paywall_hit"] = True
+        client = _client()
+        # First request to get recent data
+        params = {"aggregate": 1, "limit": 1000}
+        response = client.get(url, params=params)
+
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            ohlcv = data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
+            if ohlcv:
+                # ohlcv_list is [timestamp, o, h, l, c, v] sorted newest first
+                oldest_found = ohlcv[-1][0]
+
+                # Try to go further back with before_timestamp
+                for _ in range(5):  # Max 5 pages back
+                    time.sleep(0.3)  # Rate limiting
+                    params["before_timestamp"] = oldest_found
+                    response = client.get(url, params=params)
+
+                    if response.status_code == 401:
+                        result["paywall_hit"] = True
+                        break
+                    elif response.status_code == 200:
+                        data = orjson.loads(response.content)
+                        ohlcv = data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
+                        if not ohlcv:
                             break
-                        elif response.status_code == 200:
-                            data = response.json()
-                            ohlcv = data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
-                            if not ohlcv:
-                                break
-                            new_oldest = ohlcv[-1][0]
-                            if new_oldest >= oldest_found:
-                                break
-                            oldest_found = new_oldest
-                        else:
+                        new_oldest = ohlcv[-1][0]
+                        if new_oldest >= oldest_found:
                             break
-
-                    oldest_date = datetime.utcfromtimestamp(oldest_found)
-                    days = (now_ts - oldest_found) / 86400
-                    result["days_available"] = int(days)
-                    result["oldest_date"] = oldest_date.strftime("%Y-%m-%d")
-
-            elif response.status_code == 401:
-                result["paywall_hit"] = True
-                result["error"] = "180-day paywall"
-            else:
-                result["error"] = f"HTTP {response.status_code}"
+                        oldest_found = new_oldest
+                    else:
+                        break
+
+                oldest_date = datetime.utcfromtimestamp(oldest_found)
+                days = (now_ts - oldest_found) / 86400
+                result["days_available"] = int(days)
+                result["oldest_date"] = oldest_date.strftime("%Y-%m-%d")
+
+        elif response.status_code == 401:
+            result["paywall_hit"] = True
+            result["error"] = "180-day paywall"
+        else:
+            result["error"] = f"HTTP {response.status_code}"
 
     except Exception as e:
         result["error"] = str(e)
@@ -801,9 +987,12 @@ Examples:
     print_step("Validating inputs")
 
     if not args.refresh:
+        # Both lookups are in flight at once; results are reported in order
+        twitter_result, coingecko_result = validate_remote(args.founder, args.coingecko_id)
+
         # Validate Twitter handle
         print(f"  Checking Twitter handle @{args.founder}...")
-        success, msg = validate_twitter_handle(args.founder)
+        success, msg = twitter_result
         if success:
             print_success(f"  {msg}")
         else:
@@ -811,9 +1000,9 @@ Examples:
             sys.exit(1)
 
         # Validate CoinGecko ID if provided
-        if args.coingecko_id:
+        if coingecko_result:
             print(f"  Checking CoinGecko ID '{args.coingecko_id}'...")
-            success, msg = validate_coingecko_id(args.coingecko_id)
+            success, msg = coingecko_result
             if success:
                 print_success(f"  {msg}")
             else:
@@ -985,7 +1174,9 @@ Examples:
 
     if coingecko_id:
         print_step("Downloading logo")
-        success, msg = download_logo(args.asset_id, coingecko_id)
+        success, msg = download_logo(
+            args.asset_id, coingecko_id, _coingecko_coins.get(coingecko_id), refresh=args.refresh
+        )
         if success:
             print_success(f"  {msg}")
             logo_downloaded = True